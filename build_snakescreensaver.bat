@@ -30,19 +30,68 @@ if errorlevel 1 (
     )
 )
 
+REM Optionally compile the name generator with mypyc (falls back to pure Python)
+REM mypyc writes a shim extension plus a separate name_generator__mypyc runtime
+REM library that the shim imports from C, so PyInstaller must be told about it.
+REM Both land next to name_generator.py and are deleted again after the build,
+REM otherwise they would shadow later edits to the .py when running from source.
+set "MYPYC_IMPORTS="
+echo Compiling name generator with mypyc (optional)...
+"venv\Scripts\pip.exe" install mypy >nul 2>&1
+if errorlevel 1 (
+    echo WARNING: Could not install mypy
+)
+"venv\Scripts\mypyc.exe" retro_snake\name_generator.py
+if errorlevel 1 (
+    echo.
+    echo ========================================
+    echo WARNING: mypyc compilation FAILED ^(see errors above^)
+    echo The interpreted name generator will be bundled instead.
+    echo ========================================
+    del /q retro_snake\name_generator*.pyd >nul 2>&1
+) else (
+    echo Name generator compiled
+    set "MYPYC_IMPORTS=--hidden-import retro_snake.name_generator__mypyc"
+)
+echo.
+
+REM Optionally build the Cython Win32 bindings for the preview (falls back to ctypes)
+echo Building Win32 preview extension with Cython (optional)...
+REM Compiler/linker output is left visible so a failed build can be diagnosed
+"venv\Scripts\pip.exe" install cython >nul 2>&1
+if errorlevel 1 (
+    echo WARNING: Could not install Cython
+)
+"venv\Scripts\cythonize.exe" -i retro_snake\_win32.pyx
+if errorlevel 1 (
+    echo.
+    echo ========================================
+    echo WARNING: Cython build of retro_snake\_win32.pyx FAILED ^(see errors above^)
+    echo The preview will fall back to the slower ctypes bindings.
+    echo ========================================
+) else (
+    echo Win32 preview extension built
+)
+echo.
+
 echo Building screensaver executable...
 echo.
 
 REM Build with PyInstaller using spec file (if exists) or direct command
 if exist "RetroSnake.spec" (
     echo Using RetroSnake.spec...
+    REM The spec file must list retro_snake.name_generator__mypyc in hiddenimports itself
     "venv\Scripts\pyinstaller.exe" RetroSnake.spec
 ) else (
     echo Building from retro_snake\main.py...
-    "venv\Scripts\pyinstaller.exe" --onefile --noconsole --name "RetroSnake" --icon=snake_icon.ico retro_snake\main.py
+    "venv\Scripts\pyinstaller.exe" --onefile --noconsole --name "RetroSnake" --icon=retro_snake\assets\snake_icon.ico --add-data "retro_snake\assets\title.png;retro_snake\assets" !MYPYC_IMPORTS! retro_snake\main.py
 )
+set "BUILD_ERROR=!errorlevel!"
 
-if errorlevel 1 (
+REM Remove the in-place mypyc build so running from source uses name_generator.py again
+del /q retro_snake\name_generator*.pyd >nul 2>&1
+
+if not "!BUILD_ERROR!"=="0" (
     echo ERROR: Build failed
     pause
     exit /b 1
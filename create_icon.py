@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
 """
 Create a snake-themed icon for the screensaver
+
+One-shot development tool: the generated icon is committed under
+retro_snake/assets/ and used by the build, so this never runs at runtime.
 """
 from PIL import Image, ImageDraw
 import math
+import os
+
+# Where the generated icon files are written
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'retro_snake', 'assets')
 
 def create_snake_icon():
+    # Local binds for the math functions used in the segment/eye calculations
+    cos, sin, sqrt = math.cos, math.sin, math.sqrt
+    
     # Create a 64x64 image with transparent background
     size = 64
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
@@ -27,22 +37,18 @@ def create_snake_icon():
     radius_start = 8
     radius_end = 24
     
-    # Create snake body segments
-    segments = []
-    for i in range(60):
-        angle = i * 0.3  # Spiral angle
-        radius = radius_start + (radius_end - radius_start) * (i / 59)
-        x = center_x + radius * math.cos(angle)
-        y = center_y + radius * math.sin(angle)
-        segments.append((x, y))
+    # Create snake body segments (spiral angle 0.3 rad per segment, radius grows linearly)
+    num_segments = 60
+    radius_step = (radius_end - radius_start) / (num_segments - 1)
+    segments = [
+        (center_x + (radius_start + radius_step * i) * cos(i * 0.3),
+         center_y + (radius_start + radius_step * i) * sin(i * 0.3))
+        for i in range(num_segments)
+    ]
     
-    # Draw snake body
+    # Draw snake body as one connected polyline (curved joints smooth the corners)
     segment_size = 3
-    for i, (x, y) in enumerate(segments):
-        if i < len(segments) - 1:
-            # Draw line segment
-            next_x, next_y = segments[i + 1]
-            draw.line([x, y, next_x, next_y], fill=snake_color, width=segment_size)
+    draw.line(segments, fill=snake_color, width=segment_size, joint="curve")
     
     # Draw snake head (larger circle at the end)
     if segments:
@@ -60,7 +66,7 @@ def create_snake_icon():
             prev_x, prev_y = segments[-2]
             dx = head_x - prev_x
             dy = head_y - prev_y
-            length = math.sqrt(dx*dx + dy*dy)
+            length = sqrt(dx*dx + dy*dy)
             if length > 0:
                 # Normalize and perpendicular for eye placement
                 dx /= length
@@ -85,12 +91,14 @@ def main():
         icon = create_snake_icon()
         
         # Save as ICO file (Windows icon format)
-        icon.save('snake_icon.ico', format='ICO', sizes=[(64, 64), (32, 32), (16, 16)])
-        print("Snake icon created successfully: snake_icon.ico")
+        ico_path = os.path.join(ASSETS_DIR, 'snake_icon.ico')
+        icon.save(ico_path, format='ICO', sizes=[(64, 64), (32, 32), (16, 16)])
+        print(f"Snake icon created successfully: {ico_path}")
         
         # Also save as PNG for preview
-        icon.save('snake_icon.png', format='PNG')
-        print("Preview saved as: snake_icon.png")
+        png_path = os.path.join(ASSETS_DIR, 'snake_icon.png')
+        icon.save(png_path, format='PNG')
+        print(f"Preview saved as: {png_path}")
         
     except ImportError:
         print("Error: Pillow (PIL) is required to create the icon.")
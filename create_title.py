@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Pre-render the settings dialog title
+
+One-shot development tool: the generated image is committed under
+retro_snake/assets/ and loaded by the config dialog, so the title text is
+never rendered at runtime. Re-run it after changing the title text or font.
+"""
+import os
+
+# Keep pygame from opening a window or printing its banner
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+# Where the generated title image is written
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'retro_snake', 'assets')
+
+# Must match the title bar the dialog used to render itself
+TITLE_TEXT = "🐍 Snake Screensaver Settings"
+TITLE_FONT_SIZE = 32
+TITLE_COLOR = (255, 255, 255)
+
+def create_title_image():
+    pygame.font.init()
+    try:
+        font = pygame.font.Font(None, TITLE_FONT_SIZE)
+        # Antialiased with no background, so the PNG keeps per-pixel alpha
+        return font.render(TITLE_TEXT, True, TITLE_COLOR)
+    finally:
+        pygame.font.quit()
+
+def main():
+    try:
+        title = create_title_image()
+        png_path = os.path.join(ASSETS_DIR, 'title.png')
+        pygame.image.save(title, png_path)
+        print(f"Title image created successfully: {png_path}")
+    except Exception as e:
+        print(f"Error creating title image: {e}")
+        return False
+
+    return True
+
+if __name__ == "__main__":
+    main()
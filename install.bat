@@ -78,6 +78,8 @@ if not exist "requirements.txt" (
     exit /b 1
 )
 
+REM pygame-ce installs the same "pygame" module, so drop classic pygame from older venvs first
+"venv\Scripts\pip.exe" uninstall -y pygame >nul 2>&1
 "venv\Scripts\pip.exe" install -r requirements.txt
 if errorlevel 1 (
     echo ERROR: Failed to install dependencies
@@ -87,7 +89,7 @@ if errorlevel 1 (
 
 echo.
 echo Verifying key dependencies...
-"venv\Scripts\python.exe" -c "import pygame; print('  [OK] pygame')" 2>nul || echo "  [FAIL] pygame"
+"venv\Scripts\python.exe" -c "import pygame; print('  [OK] pygame-ce' if getattr(pygame, 'IS_CE', False) else '  [OK] pygame')" 2>nul || echo "  [FAIL] pygame"
 echo.
 
 echo ========================================
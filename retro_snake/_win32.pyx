@@ -0,0 +1,139 @@
+# cython: language_level=3
+# distutils: libraries = user32 kernel32
+"""
+Direct Win32 bindings for the preview window, compiled with Cython
+
+Optional extension: preview.py falls back to its ctypes bindings when this
+module has not been built. Window handles are passed as plain integers.
+"""
+
+from libc.stddef cimport wchar_t
+
+
+cdef extern from "windows.h":
+    ctypedef void* HWND
+    ctypedef void* HANDLE
+    ctypedef int BOOL
+    ctypedef unsigned int UINT
+    ctypedef unsigned long DWORD
+    ctypedef long LONG
+
+    ctypedef struct RECT:
+        LONG left
+        LONG top
+        LONG right
+        LONG bottom
+
+    BOOL IsWindow(HWND hWnd) nogil
+    BOOL IsWindowVisible(HWND hWnd) nogil
+    BOOL GetClientRect(HWND hWnd, RECT* lpRect) nogil
+    HWND SetParent(HWND hWndChild, HWND hWndNewParent) nogil
+    LONG GetWindowLongW(HWND hWnd, int nIndex) nogil
+    LONG SetWindowLongW(HWND hWnd, int nIndex, LONG dwNewLong) nogil
+    BOOL SetWindowPos(HWND hWnd, HWND hWndInsertAfter, int X, int Y, int cx, int cy, UINT uFlags) nogil
+    BOOL DestroyWindow(HWND hWnd) nogil
+    HWND GetParent(HWND hWnd) nogil
+    HANDLE CreateMutexW(void* lpMutexAttributes, BOOL bInitialOwner, const wchar_t* lpName) nogil
+    DWORD GetLastError() nogil
+    BOOL CloseHandle(HANDLE hObject) nogil
+
+
+cdef enum:
+    ERROR_ALREADY_EXISTS = 183
+
+
+cdef extern from "Python.h":
+    wchar_t* PyUnicode_AsWideCharString(object unicode, Py_ssize_t* size) except NULL
+    void PyMem_Free(void* p)
+
+
+cpdef bint is_window(size_t hwnd) nogil:
+    """Check if a window handle is still valid"""
+    return IsWindow(<HWND>hwnd) != 0
+
+
+cpdef bint is_window_visible(size_t hwnd) nogil:
+    """Check if a window is visible"""
+    return IsWindowVisible(<HWND>hwnd) != 0
+
+
+def get_client_rect(size_t hwnd):
+    """Get the client area of a window as (left, top, right, bottom), or None on failure"""
+    cdef RECT rect
+    if not GetClientRect(<HWND>hwnd, &rect):
+        return None
+    return (rect.left, rect.top, rect.right, rect.bottom)
+
+
+cpdef size_t set_parent(size_t child, size_t parent) nogil:
+    """Reparent a window, returning the previous parent handle"""
+    return <size_t>SetParent(<HWND>child, <HWND>parent)
+
+
+cpdef long get_window_long(size_t hwnd, int index) nogil:
+    """Read a window attribute (e.g. GWL_STYLE)"""
+    return GetWindowLongW(<HWND>hwnd, index)
+
+
+cpdef long set_window_long(size_t hwnd, int index, long value) nogil:
+    """Set a window attribute, returning the previous value"""
+    return SetWindowLongW(<HWND>hwnd, index, value)
+
+
+cpdef bint set_window_pos(size_t hwnd, size_t insert_after, int x, int y, int cx, int cy, unsigned int flags) nogil:
+    """Change a window's size, position and Z order"""
+    return SetWindowPos(<HWND>hwnd, <HWND>insert_after, x, y, cx, cy, flags) != 0
+
+
+cpdef bint destroy_window(size_t hwnd) nogil:
+    """Destroy a window"""
+    return DestroyWindow(<HWND>hwnd) != 0
+
+
+cpdef size_t get_parent(size_t hwnd) nogil:
+    """Get a window's parent handle (0 if none)"""
+    return <size_t>GetParent(<HWND>hwnd)
+
+
+def create_mutex(str name):
+    """Create or open a named mutex, returning its handle (0 on failure)"""
+    cdef wchar_t* wname = PyUnicode_AsWideCharString(name, NULL)
+    cdef HANDLE handle
+    try:
+        handle = CreateMutexW(NULL, 0, wname)
+    finally:
+        PyMem_Free(wname)
+    return <size_t>handle
+
+
+def acquire_mutex(str name):
+    """
+    Create a named mutex and check for an existing owner in one call.
+    Returns (handle, acquired): acquired is False when the name already existed
+    (our handle is closed and 0 returned); a failed create gives (0, True).
+    """
+    cdef wchar_t* wname = PyUnicode_AsWideCharString(name, NULL)
+    cdef HANDLE handle
+    cdef DWORD last_error
+    try:
+        with nogil:
+            handle = CreateMutexW(NULL, 0, wname)
+            last_error = GetLastError()
+    finally:
+        PyMem_Free(wname)
+    if handle == NULL:
+        return 0, True
+    if last_error == ERROR_ALREADY_EXISTS:
+        CloseHandle(handle)
+        return 0, False
+    return <size_t>handle, True
+
+
+cpdef unsigned long get_last_error() nogil:
+    """Get the calling thread's last Win32 error code"""
+    return GetLastError()
+
+
+cpdef bint close_handle(size_t handle) nogil:
+    """Close a kernel object handle"""
+    return CloseHandle(<HANDLE>handle) != 0
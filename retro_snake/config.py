@@ -6,6 +6,13 @@ import json
 import os
 from pathlib import Path
 
+# Try to import orjson for faster config parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Default values (can be overridden by config file)
 DEFAULT_CONFIG = {
     'num_snakes': 30, # sets the number of snakes on the screen
@@ -26,6 +33,9 @@ NUM_FOOD = DEFAULT_CONFIG['num_food']
 SPEED = DEFAULT_CONFIG['speed']
 DODGE_CHANCE = DEFAULT_CONFIG['dodge_chance'] / 100.0
 
+# Last parsed config file, keyed by its modification time
+_config_cache = {'mtime': None, 'config': None}
+
 
 def get_config_path():
     """Get path to config file in AppData"""
@@ -42,12 +52,26 @@ def load_config():
     
     try:
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            mtime = config_path.stat().st_mtime_ns
+            if _config_cache['mtime'] == mtime:
+                # File unchanged since last load, reuse the parsed values
+                config = _config_cache['config'].copy()
+            else:
+                if HAS_ORJSON:
+                    with open(config_path, 'rb') as f:
+                        config = orjson.loads(f.read())
+                else:
+                    with open(config_path, 'r') as f:
+                        config = json.load(f)
+                # Older configs stored the trail setting as trail_fade_rate
+                if 'trail_darkness' not in config and 'trail_fade_rate' in config:
+                    config['trail_darkness'] = config.pop('trail_fade_rate')
                 # Merge with defaults
                 for key in DEFAULT_CONFIG:
                     if key not in config:
                         config[key] = DEFAULT_CONFIG[key]
+                _config_cache['mtime'] = mtime
+                _config_cache['config'] = config.copy()
         else:
             config = DEFAULT_CONFIG.copy()
     except Exception:
@@ -64,6 +88,8 @@ def load_config():
 def save_config(config):
     """Save configuration to file"""
     config_path = get_config_path()
+    # Force the next load_config to re-read the file
+    _config_cache['mtime'] = None
     try:
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
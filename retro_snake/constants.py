@@ -2,6 +2,7 @@
 Constants and enums for Retro Snake Screensaver
 """
 
+import math
 from enum import Enum
 
 # Grid settings - these will be set properly when ScreenSaver initializes
@@ -26,6 +27,11 @@ GRAY = (128, 128, 128)
 # Retro color palette for variety
 RETRO_COLORS = [BRIGHT_GREEN, CYAN, MAGENTA, YELLOW, RED]
 
+# Food pulse animation - one full sine cycle of size offsets (-2..2 pixels),
+# stepped once per pulse tick (~0.15 rad per step)
+PULSE_STEPS = 42
+PULSE_LUT = tuple(math.floor(math.sin(2 * math.pi * i / PULSE_STEPS) * 2) for i in range(PULSE_STEPS))
+
 
 class Direction(Enum):
     UP = (0, -1)
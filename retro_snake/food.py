@@ -4,77 +4,83 @@ Food class for Retro Snake Screensaver
 
 import pygame
 import random
-import math
 from retro_snake import constants
 
+# Possible food colors
+FOOD_COLORS = (constants.RED, constants.YELLOW, constants.CYAN, constants.MAGENTA)
+
+# Pre-drawn random food colors, refilled in batches when empty
+COLOR_POOL_SIZE = 64
+_color_pool = []
+
+# Pre-rendered food sprites keyed by (color, half_size, cell_size)
+_sprite_cache = {}
+
+
+def next_food_color():
+    """Get a random food color from the pre-drawn pool"""
+    if not _color_pool:
+        _color_pool.extend(random.choices(FOOD_COLORS, k=COLOR_POOL_SIZE))
+    return _color_pool.pop()
+
+
+def get_food_sprite(color, half):
+    """Get a cached cell-sized sprite of the food diamond with the given half size"""
+    key = (color, half, constants.CELL_SIZE)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        cell = constants.CELL_SIZE
+        center = cell >> 1
+        sprite = pygame.Surface((cell, cell), pygame.SRCALPHA)
+        
+        # Draw pixelated diamond/apple shape
+        points = (
+            (center, center - half),
+            (center + half, center),
+            (center, center + half),
+            (center - half, center)
+        )
+        pygame.draw.polygon(sprite, color, points)
+        
+        # Retro highlight
+        pygame.draw.line(sprite, constants.WHITE,
+                        (center - 2, center - 2),
+                        (center - 4, center - 4), 2)
+        _sprite_cache[key] = sprite
+    return sprite
+
 
 class Food:
+    __slots__ = ('x', 'y', 'color', 'pulse_timer', 'base_size', 'monitor_idx',
+                 'index', 'monitor_slot')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.color = random.choice([constants.RED, constants.YELLOW, constants.CYAN, constants.MAGENTA])
-        self.pulse_timer = 0
+        self.color = next_food_color()
+        self.pulse_timer = 0  # Pulse animation tick (index into constants.PULSE_LUT)
         self.base_size = constants.CELL_SIZE - 4
+        self.monitor_idx = None  # Index of the monitor this food is shown on (set by the screensaver)
+        self.index = -1  # Position in the screensaver's food list
+        self.monitor_slot = -1  # Position in its monitor's food list
         
     def get_pos(self):
         return (self.x, self.y)
     
-    def draw(self, surface, screen_saver=None):
-        """Draw food with pulsing effect"""
-        self.pulse_timer += 0.15
-        pulse = math.sin(self.pulse_timer) * 2
-        size = self.base_size + pulse
-        
-        center_x = self.x * constants.CELL_SIZE + constants.CELL_SIZE // 2
-        center_y = self.y * constants.CELL_SIZE + constants.CELL_SIZE // 2
-        
-        # Draw pixelated diamond/apple shape
-        points = [
-            (center_x, center_y - size // 2),
-            (center_x + size // 2, center_y),
-            (center_x, center_y + size // 2),
-            (center_x - size // 2, center_y)
-        ]
-        pygame.draw.polygon(surface, self.color, points)
-        
-        # Retro highlight
-        pygame.draw.line(surface, constants.WHITE, 
-                        (center_x - 2, center_y - 2),
-                        (center_x - 4, center_y - 4), 2)
-    
-    def draw_on_monitor(self, surface, monitor):
-        """Draw food if it's visible on a specific monitor"""
-        # Don't update pulse_timer here - it's updated in the main draw loop
-        pulse = math.sin(self.pulse_timer) * 2
-        size = self.base_size + pulse
-        
-        center_x = self.x * constants.CELL_SIZE + constants.CELL_SIZE // 2
-        center_y = self.y * constants.CELL_SIZE + constants.CELL_SIZE // 2
-        
-        mon_x = monitor['x']
-        mon_y = monitor['y']
-        mon_w = monitor['width']
-        mon_h = monitor['height']
-        
-        # Skip drawing if not visible on this monitor
-        if not (mon_x <= center_x < mon_x + mon_w and mon_y <= center_y < mon_y + mon_h):
-            return
-        
-        # Convert to monitor-local coordinates
-        local_center_x = center_x - mon_x
-        local_center_y = center_y - mon_y
-        
-        # Draw pixelated diamond/apple shape
-        points = [
-            (local_center_x, local_center_y - size // 2),
-            (local_center_x + size // 2, local_center_y),
-            (local_center_x, local_center_y + size // 2),
-            (local_center_x - size // 2, local_center_y)
-        ]
-        pygame.draw.polygon(surface, self.color, points)
-        
-        # Retro highlight
-        pygame.draw.line(surface, constants.WHITE,
-                        (local_center_x - 2, local_center_y - 2),
-                        (local_center_x - 4, local_center_y - 4), 2)
+    def get_sprite(self):
+        """Get the cached sprite for the current pulse size"""
+        pulse = constants.PULSE_LUT[self.pulse_timer % constants.PULSE_STEPS]
+        half = (self.base_size + pulse) >> 1
+        return get_food_sprite(self.color, half)
+
+
+def draw_foods(surface, foods):
+    """Advance every food's pulse and draw them all with a single batched blit"""
+    cell = constants.CELL_SIZE
+    blit_list = []
+    append = blit_list.append
+    for food in foods:
+        food.pulse_timer += 1
+        append((food.get_sprite(), (food.x * cell, food.y * cell)))
+    surface.blits(blit_list, doreturn=False)
 
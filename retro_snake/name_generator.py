@@ -1,11 +1,19 @@
 """
 Name generator module for Retro Snake Screensaver
 Combines syllable-based generation with Markov chains from real names
+
+Type-annotated so the build can compile it with mypyc; the plain module is
+used whenever the compiled extension is not present.
 """
 
 import random
 import re
 from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Set, Tuple
+
+# Markov chain types: syllable-tuple -> possible next syllables
+Chain = DefaultDict[Tuple[str, ...], List[str]]
+FrozenChain = Dict[Tuple[str, ...], Tuple[str, ...]]
 
 
 # Corpus of real names to learn syllable patterns from
@@ -48,14 +56,26 @@ BAD_CLUSTERS = [
     "xw", "wx", "zw", "wz", "qg", "gq", "jz", "zj"
 ]
 
-# Patterns that are hard to pronounce
-BAD_PATTERNS = [
-    r'[bcdfghjklmnpqrstvwxyz]{4,}',  # 4+ consecutive consonants
-    r'[aeiouy]{4,}',  # 4+ consecutive vowels
-]
+# Letter runs that are hard to pronounce (4+ consecutive consonants/vowels)
+MAX_LETTER_RUN = 3
 
+# Precompiled regexes (compiled once at import instead of looked up per call)
+_FIRST_CONSONANTS_RE = re.compile(r'[bcdfghjklmnpqrstvwxyz]+')
+_CONSONANT_VOWEL_RE = re.compile(r'[bcdfghjklmnpqrstvwxyz]+[aeiouy]+')
+_VOWEL_SPLIT_RE = re.compile(r'([aeiouy]+)')
+_BAD_CLUSTERS_RE = re.compile('|'.join(BAD_CLUSTERS))
 
-def extract_syllables(name):
+# Translation tables mapping letters to 'C' (consonant) / 'V' (vowel) classes.
+# Two tables because 'y' counts as both a consonant and a vowel.
+_CONSONANTS = 'bcdfghjklmnpqrstvwxyz'
+_VOWELS = 'aeiouy'
+_CONSONANT_TABLE = str.maketrans(_CONSONANTS, 'C' * len(_CONSONANTS))
+_VOWEL_TABLE = str.maketrans(_VOWELS, 'V' * len(_VOWELS))
+_CONSONANT_RUN = 'C' * (MAX_LETTER_RUN + 1)
+_VOWEL_RUN = 'V' * (MAX_LETTER_RUN + 1)
+
+
+def extract_syllables(name: str) -> List[str]:
     """
     Extract syllables from a name using improved vowel-based splitting.
     Handles names starting with vowels and consonant clusters better.
@@ -63,12 +83,12 @@ def extract_syllables(name):
     """
     # Convert to lowercase for consistency
     name = name.lower()
-    syllables = []
+    syllables: List[str] = []
     
     # Handle names starting with vowels
     if name and name[0] in 'aeiouy':
         # Find the first consonant group
-        match = re.search(r'[bcdfghjklmnpqrstvwxyz]+', name)
+        match = _FIRST_CONSONANTS_RE.search(name)
         if match:
             # First syllable is the vowel(s) + first consonant(s)
             vowel_part = name[:match.start()]
@@ -81,8 +101,7 @@ def extract_syllables(name):
     
     # Now process the rest: consonant-vowel patterns
     # This regex finds consonant groups followed by vowel groups
-    pattern = r'[bcdfghjklmnpqrstvwxyz]+[aeiouy]+'
-    matches = re.finditer(pattern, name)
+    matches = _CONSONANT_VOWEL_RE.finditer(name)
     
     for match in matches:
         syllables.append(match.group())
@@ -99,34 +118,44 @@ def extract_syllables(name):
             syllables.append(name)
         # Otherwise, trailing consonants are too long, skip them
     
-    # Fallback: if no syllables found, try simpler vowel-based split
     if not syllables:
-        # Split by vowels, keeping vowels with preceding consonants
-        parts = re.split(r'([aeiouy]+)', name)
-        syllables = []
-        i = 0
-        while i < len(parts):
-            if parts[i] and parts[i][0] in 'bcdfghjklmnpqrstvwxyz':
-                # Consonant part
-                if i + 1 < len(parts) and parts[i + 1]:
-                    # Combine with next vowel part
-                    syllables.append(parts[i] + parts[i + 1])
-                    i += 2
-                else:
-                    # Trailing consonants - attach to previous if exists
-                    if syllables:
-                        syllables[-1] += parts[i]
-                    i += 1
-            elif parts[i] and parts[i][0] in 'aeiouy':
-                # Vowel-only part at start
-                if i + 1 < len(parts) and parts[i + 1]:
-                    syllables.append(parts[i] + parts[i + 1])
-                    i += 2
-                else:
-                    syllables.append(parts[i])
-                    i += 1
+        # Rare: the consonant-vowel pass found nothing
+        return _extract_syllables_slow(name)
+    
+    return [s for s in syllables if s]  # Remove empty strings
+
+
+def _extract_syllables_slow(name: str) -> List[str]:
+    """
+    Fallback syllable extraction for names the consonant-vowel pass can't split.
+    Tries a vowel-based split first, then falls back to fixed-size chunks.
+    """
+    # Split by vowels, keeping vowels with preceding consonants
+    parts = _VOWEL_SPLIT_RE.split(name)
+    syllables: List[str] = []
+    i = 0
+    while i < len(parts):
+        if parts[i] and parts[i][0] in 'bcdfghjklmnpqrstvwxyz':
+            # Consonant part
+            if i + 1 < len(parts) and parts[i + 1]:
+                # Combine with next vowel part
+                syllables.append(parts[i] + parts[i + 1])
+                i += 2
+            else:
+                # Trailing consonants - attach to previous if exists
+                if syllables:
+                    syllables[-1] += parts[i]
+                i += 1
+        elif parts[i] and parts[i][0] in 'aeiouy':
+            # Vowel-only part at start
+            if i + 1 < len(parts) and parts[i + 1]:
+                syllables.append(parts[i] + parts[i + 1])
+                i += 2
             else:
+                syllables.append(parts[i])
                 i += 1
+        else:
+            i += 1
     
     # Final fallback: split into reasonable chunks
     if not syllables:
@@ -143,13 +172,13 @@ def extract_syllables(name):
     return [s for s in syllables if s and len(s) >= 1]  # Remove empty strings, keep at least 1 char
 
 
-def build_markov_chain(corpus, order=1):
+def build_markov_chain(corpus: List[str], order: int = 1) -> Chain:
     """
     Build a Markov chain from the name corpus.
     order=1 means we look at transitions between adjacent syllables.
     Returns a dict: {syllable: [list of possible next syllables]}
     """
-    chain = defaultdict(list)
+    chain: Chain = defaultdict(list)
     
     for name in corpus:
         syllables = extract_syllables(name)
@@ -168,7 +197,20 @@ def build_markov_chain(corpus, order=1):
     return chain
 
 
-def is_pronounceable(name):
+def freeze_chain(chain: Chain) -> FrozenChain:
+    """
+    Convert a Markov chain's transition lists to tuples for fast read-only sampling.
+    Returns a plain dict: {syllable: (possible next syllables)}
+    """
+    return {key: tuple(values) for key, values in chain.items()}
+
+
+# Markov chain for the built-in corpus, built once at import and shared by
+# every NameGenerator that uses the default corpus
+_DEFAULT_CHAIN = freeze_chain(build_markov_chain(NAME_CORPUS))
+
+
+def is_pronounceable(name: str) -> bool:
     """
     Check if a name is pronounceable by validating against bad patterns.
     Returns True if the name seems pronounceable.
@@ -176,21 +218,23 @@ def is_pronounceable(name):
     name_lower = name.lower()
     
     # Check for bad consonant clusters
-    for cluster in BAD_CLUSTERS:
-        if cluster in name_lower:
-            return False
+    if _BAD_CLUSTERS_RE.search(name_lower):
+        return False
+    
+    # Map letters to consonant/vowel classes in a single pass each
+    consonants = name_lower.translate(_CONSONANT_TABLE)
+    vowels = name_lower.translate(_VOWEL_TABLE)
     
     # Check for bad patterns (too many consecutive consonants/vowels)
-    for pattern in BAD_PATTERNS:
-        if re.search(pattern, name_lower):
-            return False
+    if _CONSONANT_RUN in consonants or _VOWEL_RUN in vowels:
+        return False
     
     # Must have at least one vowel
-    if not re.search(r'[aeiouy]', name_lower):
+    if 'V' not in vowels:
         return False
     
     # Must have at least one consonant
-    if not re.search(r'[bcdfghjklmnpqrstvwxyz]', name_lower):
+    if 'C' not in consonants:
         return False
     
     return True
@@ -199,7 +243,7 @@ def is_pronounceable(name):
 class NameGenerator:
     """Generates realistic-sounding names using Markov chains and syllables"""
     
-    def __init__(self, corpus=None, min_length=4, max_length=12):
+    def __init__(self, corpus: Optional[List[str]] = None, min_length: int = 4, max_length: int = 12) -> None:
         """
         Initialize the name generator.
         
@@ -211,10 +255,13 @@ class NameGenerator:
         self.corpus = corpus or NAME_CORPUS
         self.min_length = min_length
         self.max_length = max_length
-        self.chain = build_markov_chain(self.corpus)
-        self.generated_names = set()  # Track generated names to avoid duplicates
+        if corpus is None:
+            self.chain = _DEFAULT_CHAIN
+        else:
+            self.chain = freeze_chain(build_markov_chain(self.corpus))
+        self.generated_names: Set[str] = set()  # Track generated names to avoid duplicates
     
-    def generate(self, max_attempts=100):
+    def generate(self, max_attempts: int = 100) -> str:
         """
         Generate a single name.
         
@@ -235,27 +282,30 @@ class NameGenerator:
         # Fallback: generate a simple name if Markov fails
         return self._generate_fallback()
     
-    def _generate_one(self):
+    def _generate_one(self) -> Optional[str]:
         """Generate one name using the Markov chain"""
-        if not self.chain:
+        chain = self.chain
+        if not chain:
             return None
         
         # Start with a random starting syllable
-        if () not in self.chain or not self.chain[()]:
+        starts = chain.get(())
+        if not starts:
             return None
         
-        syllables = [random.choice(self.chain[()])]
+        choice = random.choice
+        syllables = [choice(starts)]
         
         # Follow the chain - ensure at least 2 syllables for better names
         max_syllables = (self.max_length // 2) + 3  # Rough estimate, allow a bit more
         min_syllables = 2  # Minimum syllables for better names
         
         for _ in range(max_syllables):
-            current = (syllables[-1],)
-            if current not in self.chain or not self.chain[current]:
+            options = chain.get((syllables[-1],))
+            if not options:
                 break
             
-            next_syllable = random.choice(self.chain[current])
+            next_syllable = choice(options)
             syllables.append(next_syllable)
             
             # Check if we've reached a good length
@@ -290,7 +340,7 @@ class NameGenerator:
             return name
         return None
     
-    def _generate_fallback(self):
+    def _generate_fallback(self) -> str:
         """Fallback generator using simple syllable combinations"""
         # Well-tested syllable combinations that sound natural
         prefixes = ["al", "ka", "ze", "mi", "to", "ri", "sa", "na", "el", "jo", 
@@ -332,16 +382,16 @@ class NameGenerator:
         # Ultimate fallback
         return "Snake"
     
-    def reset_cache(self):
+    def reset_cache(self) -> None:
         """Clear the cache of generated names (useful for testing)"""
         self.generated_names.clear()
 
 
 # Global generator instance for easy use
-_generator = None
+_generator: Optional[NameGenerator] = None
 
 
-def get_generator():
+def get_generator() -> NameGenerator:
     """Get or create the global name generator instance"""
     global _generator
     if _generator is None:
@@ -349,7 +399,7 @@ def get_generator():
     return _generator
 
 
-def generate_name(min_length=4, max_length=12):
+def generate_name(min_length: int = 4, max_length: int = 12) -> str:
     """
     Convenience function to generate a single name.
     
@@ -6,6 +6,7 @@ import pygame
 import random
 import math
 import os
+from collections import deque
 from retro_snake import constants
 from retro_snake.utils import cleanup_pygame
 
@@ -115,10 +116,47 @@ else:
     def GetParent(*args):
         return None
 
+# Prefer the compiled Cython bindings (retro_snake/_win32.pyx) for the per-frame
+# window checks - they skip libffi's argument marshalling on every call
+_acquire_mutex = None
+if HAS_WIN32:
+    try:
+        from retro_snake import _win32
+        IsWindow = _win32.is_window
+        IsWindowVisible = _win32.is_window_visible
+        _acquire_mutex = _win32.acquire_mutex
+    except ImportError:
+        pass  # Extension not built, keep the ctypes bindings
+
 
 # Mutex name for preventing multiple preview instances
 PREVIEW_MUTEX_NAME = "RetroSnakeScreensaverPreviewMutex"
 
+# Preallocated ctypes arguments (the wide string is encoded once at import, and
+# GetClientRect writes into the shared RECT through byref() - read it right away)
+_MUTEX_NAME_W = ctypes.c_wchar_p(PREVIEW_MUTEX_NAME)
+_RECT_BUF = RECT()
+
+# The preview pane is tiny, so a low frame rate is plenty
+PREVIEW_FPS = 20
+
+# Frames in one food pulse cycle (2*pi / 0.1 rounded)
+FOOD_PULSE_PERIOD = 63
+
+# Direction tables for the preview snake AI
+_PERP = {
+    (1, 0): ((0, -1), (0, 1)),
+    (-1, 0): ((0, -1), (0, 1)),
+    (0, 1): ((-1, 0), (1, 0)),
+    (0, -1): ((-1, 0), (1, 0)),
+}
+_OPPOSITE = {(1, 0): (-1, 0), (-1, 0): (1, 0), (0, 1): (0, -1), (0, -1): (0, 1)}
+
+# Bound RNG methods for the per-frame update path
+_rand = random.random
+_randint = random.randint
+_choice = random.choice
+
 
 def acquire_preview_mutex():
     """
@@ -129,10 +167,17 @@ def acquire_preview_mutex():
     if not HAS_WIN32:
         return None, True  # No mutex available, allow to proceed
     
+    if _acquire_mutex is not None:
+        # CreateMutexW + GetLastError in a single native call
+        try:
+            mutex, acquired = _acquire_mutex(PREVIEW_MUTEX_NAME)
+            return mutex or None, acquired
+        except Exception:
+            return None, True
+    
     try:
         # Try to create/open the mutex
-        mutex_name = ctypes.c_wchar_p(PREVIEW_MUTEX_NAME)
-        mutex = CreateMutex(None, False, mutex_name)
+        mutex = CreateMutex(None, False, _MUTEX_NAME_W)
         if not mutex:
             return None, True  # Failed to create, allow to proceed
         
@@ -179,7 +224,7 @@ class PreviewWindow:
         self.parent_hwnd = parent_hwnd
         
         # Get the client area size of the preview window
-        rect = RECT()
+        rect = _RECT_BUF
         result = GetClientRect(parent_hwnd, ctypes.byref(rect))
         if not result:
             error_code = GetLastError()
@@ -187,26 +232,39 @@ class PreviewWindow:
         self.width = rect.right - rect.left
         self.height = rect.bottom - rect.top
         
-        # Clean up any existing pygame instance first
-        try:
-            pygame.quit()
-        except:
-            pass
-        
         # Set SDL_WINDOWID BEFORE pygame.init() to embed in parent window
         os.environ['SDL_WINDOWID'] = str(parent_hwnd)
         
-        # Initialize pygame fresh
+        # SDL only reads SDL_WINDOWID when the display starts, so restart it if
+        # something already brought it up (nothing does on the normal /p path)
+        if pygame.display.get_init():
+            pygame.display.quit()
+        
         pygame.init()
         
         # Create pygame display - it will be embedded in parent_hwnd due to SDL_WINDOWID
         self.screen = pygame.display.set_mode((self.width, self.height))
         
-        # Get the pygame window handle
-        pygame_hwnd = pygame.display.get_wm_info()['window']
+        # Pre-render the title text
+        self._font = pygame.font.Font(None, 16)
+        self._title = self._font.render("Hack's Retro Snakes", True, constants.CYAN)
+        title_rect = self._title.get_rect(center=(self.width // 2, self.height - 15))
+        self._title_pos = title_rect.topleft
         
-        # Store pygame hwnd for later use
-        self.pygame_hwnd = pygame_hwnd
+        # Pre-composite everything static (background, grid, title shadow)
+        # into one surface that is blitted each frame
+        self._bg = pygame.Surface((self.width, self.height)).convert()
+        self._bg.fill(constants.BLACK)
+        grid_size = 20
+        for x in range(0, self.width, grid_size):
+            pygame.draw.line(self._bg, (20, 20, 20), (x, 0), (x, self.height))
+        for y in range(0, self.height, grid_size):
+            pygame.draw.line(self._bg, (20, 20, 20), (0, y), (self.width, y))
+        title_shadow = self._font.render("Hack's Retro Snakes", True, constants.BLACK)
+        self._bg.blit(title_shadow, (title_rect.x + 1, title_rect.y + 1))
+        
+        # Store the pygame window handle for the visibility checks in run()
+        self.pygame_hwnd = pygame.display.get_wm_info().get('window')
         
         self.clock = pygame.time.Clock()
         self.running = True
@@ -215,10 +273,10 @@ class PreviewWindow:
         self.snake_segments = 6
         self.snake_size = 6
         self.snake_spacing = 8
-        self.snake_pos = [(self.width // 2, self.height // 2)]
+        self.snake_pos = deque([(self.width // 2, self.height // 2)], maxlen=15)  # Max length in preview
         self.snake_direction = (1, 0)  # Moving right initially (tuple not list)
         self.move_timer = 0
-        self.move_delay = 3  # Frames between moves (faster like settings demo)
+        self.move_delay = 2  # Frames between moves (faster like settings demo)
         
         # Initialize snake body
         for i in range(1, self.snake_segments):
@@ -228,22 +286,36 @@ class PreviewWindow:
                 last[1]
             ))
         
+        # Body fade colors for every snake length, indexed [length][segment]
+        max_len = self.snake_pos.maxlen
+        self._body_colors = tuple(
+            tuple((0, int(200 * (1 - (i / n) * 0.5)), 0) for i in range(n))
+            for n in range(max_len + 1)
+        )
+        
         # Food position
         self.food_pos = self.generate_food()
         
         # Animation state
         self.frame = 0
+        
+        # Food pulse colors for one full sin(frame * 0.1) cycle (~2*pi/0.1 frames)
+        self._food_color_lut = tuple(
+            (255, int(128 + 127 * math.sin(i * 0.1)), 0) for i in range(FOOD_PULSE_PERIOD)
+        )
     
     def generate_food(self):
         """Generate food position away from snake"""
         margin = 20
         max_attempts = 10
         for _ in range(max_attempts):
-            x = random.randint(margin, self.width - margin)
-            y = random.randint(margin, self.height - margin)
+            x = _randint(margin, self.width - margin)
+            y = _randint(margin, self.height - margin)
             # Check if far enough from snake head
             head = self.snake_pos[0]
-            if math.sqrt((x - head[0])**2 + (y - head[1])**2) > 30:
+            dx = x - head[0]
+            dy = y - head[1]
+            if dx * dx + dy * dy > 900:  # 30px, compared squared
                 return (x, y)
         return (self.width // 2 + 40, self.height // 2 + 40)
     
@@ -256,87 +328,66 @@ class PreviewWindow:
             self.move_timer = 0
             
             # Move snake
-            head = self.snake_pos[0]
-            new_head = (
-                head[0] + self.snake_direction[0] * self.snake_spacing,
-                head[1] + self.snake_direction[1] * self.snake_spacing
-            )
+            spacing = self.snake_spacing
+            head_x, head_y = self.snake_pos[0]
+            dir_x, dir_y = self.snake_direction
             
-            # Random turns for more interesting movement (like settings demo)
-            if random.random() < 0.15:
-                if self.snake_direction[0] != 0:
-                    self.snake_direction = (0, random.choice([-1, 1]))
-                else:
-                    self.snake_direction = (random.choice([-1, 1]), 0)
+            # Food offset from where the head would land going straight
+            head_to_food_x = self.food_pos[0] - head_x - dir_x * spacing
+            head_to_food_y = self.food_pos[1] - head_y - dir_y * spacing
             
-            # Check if heading towards food
-            head_to_food_x = self.food_pos[0] - new_head[0]
-            head_to_food_y = self.food_pos[1] - new_head[1]
+            # Random turns for more interesting movement (like settings demo)
+            if _rand() < 0.15:
+                self.snake_direction = _choice(_PERP[self.snake_direction])
             
-            # Simple AI - turn towards food sometimes
-            if random.random() < 0.3:
+            # Simple AI - turn towards food sometimes (never straight back)
+            if _rand() < 0.3:
                 if abs(head_to_food_x) > abs(head_to_food_y):
-                    if head_to_food_x > 0 and self.snake_direction[0] != -1:
-                        self.snake_direction = (1, 0)
-                    elif head_to_food_x < 0 and self.snake_direction[0] != 1:
-                        self.snake_direction = (-1, 0)
+                    seek = (1, 0) if head_to_food_x > 0 else (-1, 0)
+                elif head_to_food_y:
+                    seek = (0, 1) if head_to_food_y > 0 else (0, -1)
                 else:
-                    if head_to_food_y > 0 and self.snake_direction[1] != -1:
-                        self.snake_direction = (0, 1)
-                    elif head_to_food_y < 0 and self.snake_direction[1] != 1:
-                        self.snake_direction = (0, -1)
-            
-            # Recalculate new head with potentially updated direction
-            new_head = (
-                head[0] + self.snake_direction[0] * self.snake_spacing,
-                head[1] + self.snake_direction[1] * self.snake_spacing
-            )
+                    seek = None
+                if seek and seek != _OPPOSITE[self.snake_direction]:
+                    self.snake_direction = seek
             
             # Bounce off edges instead of wrapping for more visible movement
-            if new_head[0] < 10 or new_head[0] > self.width - 10:
-                self.snake_direction = (-self.snake_direction[0], self.snake_direction[1])
-                new_head = (
-                    head[0] + self.snake_direction[0] * self.snake_spacing,
-                    head[1]
-                )
-            if new_head[1] < 10 or new_head[1] > self.height - 10:
-                self.snake_direction = (self.snake_direction[0], -self.snake_direction[1])
-                new_head = (
-                    new_head[0],
-                    head[1] + self.snake_direction[1] * self.snake_spacing
-                )
+            dir_x, dir_y = self.snake_direction
+            new_x = head_x + dir_x * spacing
+            if new_x < 10 or new_x > self.width - 10:
+                dir_x = -dir_x
+                new_x = head_x + dir_x * spacing
+            new_y = head_y + dir_y * spacing
+            if new_y < 10 or new_y > self.height - 10:
+                dir_y = -dir_y
+                new_y = head_y + dir_y * spacing
+            self.snake_direction = (dir_x, dir_y)
+            new_head = (new_x, new_y)
             
             # Check if food eaten
-            if math.sqrt((new_head[0] - self.food_pos[0])**2 + 
-                        (new_head[1] - self.food_pos[1])**2) < self.snake_spacing:
+            dx = new_head[0] - self.food_pos[0]
+            dy = new_head[1] - self.food_pos[1]
+            if dx * dx + dy * dy < self.snake_spacing * self.snake_spacing:
                 self.food_pos = self.generate_food()
-                # Don't remove tail (grow)
-                self.snake_pos.insert(0, new_head)
-                if len(self.snake_pos) > 15:  # Max length in preview
-                    self.snake_pos.pop()
+                # Don't remove tail (grow) - maxlen trims it once at max length
+                self.snake_pos.appendleft(new_head)
             else:
                 # Normal move
-                self.snake_pos.insert(0, new_head)
                 self.snake_pos.pop()
+                self.snake_pos.appendleft(new_head)
     
     def draw(self):
         """Draw preview animation"""
-        # Background
-        self.screen.fill(constants.BLACK)
-        
-        # Draw grid (subtle)
-        grid_size = 20
-        for x in range(0, self.width, grid_size):
-            pygame.draw.line(self.screen, (20, 20, 20), (x, 0), (x, self.height))
-        for y in range(0, self.height, grid_size):
-            pygame.draw.line(self.screen, (20, 20, 20), (0, y), (self.width, y))
+        # Background, subtle grid and title shadow
+        self.screen.blit(self._bg, (0, 0))
         
         # Draw food
-        food_pulse = int(128 + 127 * math.sin(self.frame * 0.1))
-        food_color = (255, food_pulse, 0)
+        food_color = self._food_color_lut[self.frame % FOOD_PULSE_PERIOD]
         pygame.draw.circle(self.screen, food_color, self.food_pos, self.snake_size - 1)
         
-        # Draw snake
+        # Draw snake (solid fills are cheaper than pygame.draw.rect)
+        fill = self.screen.fill
+        body_colors = self._body_colors[len(self.snake_pos)]
         for i, pos in enumerate(self.snake_pos):
             if i == 0:
                 # Head - brighter
@@ -344,104 +395,80 @@ class PreviewWindow:
                 size = self.snake_size
             else:
                 # Body - darker
-                fade = 1 - (i / len(self.snake_pos)) * 0.5
-                color = (0, int(200 * fade), 0)
+                color = body_colors[i]
                 size = self.snake_size - 1
             
-            pygame.draw.rect(self.screen, color, 
-                           (pos[0] - size//2, pos[1] - size//2, size, size))
+            fill(color, (pos[0] - size//2, pos[1] - size//2, size, size))
         
         # Draw title text
-        try:
-            font = pygame.font.Font(None, 16)
-            text = font.render("Hack's Retro Snakes", True, constants.CYAN)
-            text_rect = text.get_rect(center=(self.width // 2, self.height - 15))
-            # Draw shadow
-            shadow = font.render("Hack's Retro Snakes", True, constants.BLACK)
-            self.screen.blit(shadow, (text_rect.x + 1, text_rect.y + 1))
-            self.screen.blit(text, text_rect)
-        except:
-            pass
+        self.screen.blit(self._title, self._title_pos)
         
         pygame.display.flip()
     
     def run(self):
         """Run the preview loop"""
-        pygame_hwnd = getattr(self, 'pygame_hwnd', None)
+        pygame_hwnd = self.pygame_hwnd
         try:
-            # Store pygame window handle for cleanup
-            if not pygame_hwnd:
-                try:
-                    pygame_hwnd = pygame.display.get_wm_info()['window']
-                except:
-                    pass
-            
             frame_count = 0
+            # Window validity only needs polling a couple of times per second
+            check_interval = 10
+            
+            # Bind loop call targets to locals (skips global/attribute lookups per frame)
+            _is_window = IsWindow
+            _is_visible = IsWindowVisible
+            _event_peek = pygame.event.peek
+            _clock_tick = self.clock.tick
+            _update = self.update
+            _draw = self.draw
+            _QUIT = pygame.QUIT
+            parent_hwnd = self.parent_hwnd
+            
+            # Only QUIT matters here - have SDL drop everything else at the source
+            # (everything starts allowed, so block all first; peek never drains
+            # the queue, so anything let through would pile up)
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([_QUIT])
             
             while self.running:
                 frame_count += 1
                 
-                # Check if parent window still exists
-                try:
-                    if not IsWindow(self.parent_hwnd):
-                        self.running = False
-                        break
-                except:
-                    self.running = False
-                    break
-                
-                # Only check visibility after window has had time to initialize (after frame 30)
-                # This prevents false positives during startup
-                if frame_count > 30 and pygame_hwnd:
+                if frame_count % check_interval == 0:
+                    # Check if parent window still exists (a dead handle never comes back)
                     try:
-                        if not IsWindow(pygame_hwnd):
-                            self.running = False
-                            break
-                        # Check if window is still visible (indicates another screensaver selected)
-                        if not IsWindowVisible(pygame_hwnd):
+                        if not _is_window(parent_hwnd):
                             self.running = False
                             break
                     except:
-                        pass
-                
-                # Process events - check for quit
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
                         self.running = False
                         break
+                    
+                    # Only check visibility after window has had time to initialize (after ~1 second)
+                    # This prevents false positives during startup
+                    if frame_count > PREVIEW_FPS and pygame_hwnd:
+                        try:
+                            # Check if window is still visible (indicates another screensaver
+                            # selected) - this is also FALSE for a destroyed window
+                            if not _is_visible(pygame_hwnd):
+                                self.running = False
+                                break
+                        except:
+                            pass
                 
-                if not self.running:
+                # Check for quit (peek pumps the queue without building Event objects)
+                if _event_peek(_QUIT):
+                    self.running = False
                     break
                 
-                self.update()
-                self.draw()
-                self.clock.tick(30)
+                _update()
+                _draw()
+                _clock_tick(PREVIEW_FPS)
         except Exception as e:
             pass  # Silently handle errors in preview
         finally:
-            # Clean up properly to prevent stacking instances
-            self.running = False
-            
-            # Release the mutex
-            release_preview_mutex(getattr(self, 'mutex_handle', None))
-            
-            try:
-                if pygame_hwnd and IsWindow(pygame_hwnd):
-                    DestroyWindow(pygame_hwnd)
-            except:
-                pass
-            
-            try:
-                pygame.display.quit()
-            except:
-                pass
-            
-            try:
-                pygame.quit()
-            except:
-                pass
-            
-            # Force immediate process termination for preview mode
+            # Release the mutex so the next preview can start, then terminate
+            # immediately - process exit destroys the embedded window and frees
+            # every SDL handle, so tearing pygame down first is wasted work
+            release_preview_mutex(self.mutex_handle)
             os._exit(0)
 
 
@@ -461,15 +488,18 @@ def run_fallback_preview():
         font = pygame.font.Font(None, 20)
         clock = pygame.time.Clock()
         
+        # Only QUIT is ever looked at, and peek doesn't drain the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT])
+        
         running = True
-        snake_pos = [(100, 75), (110, 75), (120, 75)]
+        snake_pos = deque([(100, 75), (110, 75), (120, 75)], maxlen=3)
         direction = (-1, 0)
         timer = 0
         
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
+            if pygame.event.peek(pygame.QUIT):
+                running = False
             
             screen.fill(constants.BLACK)
             
@@ -481,8 +511,7 @@ def run_fallback_preview():
                 if new_head[0] < 10 or new_head[0] > 180:
                     direction = (-direction[0], direction[1])
                     new_head = (head[0] + direction[0] * 10, head[1] + direction[1] * 10)
-                snake_pos.insert(0, new_head)
-                snake_pos.pop()
+                snake_pos.appendleft(new_head)  # maxlen drops the tail
             
             for i, pos in enumerate(snake_pos):
                 color = constants.BRIGHT_GREEN if i == 0 else (0, 180, 0)
@@ -492,7 +521,7 @@ def run_fallback_preview():
             screen.blit(text, (35, 130))
             
             pygame.display.flip()
-            clock.tick(30)
+            clock.tick(PREVIEW_FPS)
     finally:
         # Release the mutex
         release_preview_mutex(mutex_handle)
@@ -6,11 +6,13 @@ import pygame
 import random
 import os
 import colorsys
+import math
+from itertools import compress
 from screeninfo import get_monitors
 from retro_snake import constants
-from retro_snake.config import SPEED
+from retro_snake.config import DEFAULT_CONFIG, load_config
 from retro_snake.snake import Snake
-from retro_snake.food import Food
+from retro_snake.food import Food, draw_foods
 from retro_snake.starfield import StarField
 from retro_snake.name_generator import generate_name
 
@@ -35,6 +37,18 @@ except (OSError, AttributeError, ImportError):
     HAS_WIN32_POWER = False
 
 
+# bytes.translate table marking empty occupancy cells with 1 and occupied ones with 0
+_FREE_CELL_TABLE = bytes([1] + [0] * 255)
+
+# Star count at 1920x1080, scaled with the square root of the desktop area and capped
+# so multi-monitor setups don't pay linear per-frame starfield cost
+BASE_STARS = 150
+MAX_STARS = 600
+
+# Rendered leaderboard strings kept around before the oldest is dropped
+TEXT_CACHE_SIZE = 256
+
+
 def capture_desktop_screenshot():
     """Capture a screenshot of the entire desktop before pygame takes over"""
     if not HAS_PIL:
@@ -48,6 +62,57 @@ def capture_desktop_screenshot():
         return None
 
 
+class DeathAnimation:
+    """Dissolving particles of a dead snake, stored as parallel per-particle lists"""
+    __slots__ = ('snake_index', 'color', 'timer',
+                 'xs', 'ys', 'vxs', 'vys', 'alphas', 'sizes', 'decays', 'colors')
+    
+    def __init__(self, snake_index, color):
+        self.snake_index = snake_index
+        self.color = color
+        self.timer = 0
+        self.xs = []
+        self.ys = []
+        self.vxs = []
+        self.vys = []
+        self.alphas = []
+        self.sizes = []
+        self.decays = []
+        self.colors = []
+    
+    def add_particle(self, x, y, vx, vy, size, decay, color):
+        """Add a fully opaque particle"""
+        self.xs.append(x)
+        self.ys.append(y)
+        self.vxs.append(vx)
+        self.vys.append(vy)
+        self.alphas.append(255)
+        self.sizes.append(size)
+        self.decays.append(decay)
+        self.colors.append(color)
+    
+    def update(self):
+        """Advance particle physics one frame and drop fully faded particles"""
+        self.timer += 1
+        self.xs = [x + vx for x, vx in zip(self.xs, self.vxs)]
+        self.ys = [y + vy for y, vy in zip(self.ys, self.vys)]
+        self.vys = [vy + 0.1 for vy in self.vys]  # Gravity
+        self.alphas = [a - d for a, d in zip(self.alphas, self.decays)]
+        self.sizes = [s - 0.1 if s > 1.1 else 1 for s in self.sizes]  # Shrink to a 1px minimum
+        
+        # Remove dead particles (compact every list with the same mask)
+        alphas = self.alphas
+        if alphas and min(alphas) <= 0:
+            keep = [i for i, a in enumerate(alphas) if a > 0]
+            for name in ('xs', 'ys', 'vxs', 'vys', 'alphas', 'sizes', 'decays', 'colors'):
+                values = getattr(self, name)
+                setattr(self, name, [values[i] for i in keep])
+    
+    def is_finished(self):
+        """Animation complete when all particles are gone or timeout"""
+        return not self.alphas or self.timer > 60
+
+
 class ScreenSaver:
     def __init__(self, windowed=False, desktop_screenshot=None):
         
@@ -147,33 +212,52 @@ class ScreenSaver:
         
         self.clock = pygame.time.Clock()
         self.running = True
-        from retro_snake.config import SPEED
-        self.fps = SPEED  # Configurable speed
+        
+        # Read the config once - respawns reuse these values instead of re-reading the file
+        self._cfg = config = load_config()
+        self.fps = config.get('speed', DEFAULT_CONFIG['speed'])  # Configurable speed
+        num_snakes = config.get('num_snakes', DEFAULT_CONFIG['num_snakes'])
+        num_food = config.get('num_food', DEFAULT_CONFIG['num_food'])
+        
+        # Starting length range for new snakes (ensure min is not greater than max)
+        self._min_len = config.get('min_starting_length', 4)
+        self._max_len = config.get('max_starting_length', 4)
+        if self._min_len > self._max_len:
+            self._min_len, self._max_len = self._max_len, self._min_len
         
         # Initialize starfield background (more stars for larger space)
-        num_stars = int(150 * (self.virtual_width * self.virtual_height) / (1920 * 1080))
+        area_ratio = (self.virtual_width * self.virtual_height) / (1920 * 1080)
+        num_stars = min(MAX_STARS, int(BASE_STARS * math.sqrt(area_ratio)))
         self.starfield = StarField(num_stars, self.virtual_width, self.virtual_height)
         
+        # Occupancy grid: number of snake segments on each cell, indexed
+        # y * GRID_WIDTH + x and kept in sync as snakes move (food is not counted)
+        self._occ = bytearray(constants.GRID_WIDTH * constants.GRID_HEIGHT)
+        
         # Initialize multiple snakes with unique colors
         self.snakes = []
-        from retro_snake.config import NUM_SNAKES, NUM_FOOD
-        self.snake_colors = self.generate_unique_colors(NUM_SNAKES)
+        self.snake_colors = self.generate_unique_colors(num_snakes)
         # Generate unique names for each snake
-        self.snake_names = [generate_name() for _ in range(NUM_SNAKES)]
-        for i in range(NUM_SNAKES):
+        self.snake_names = [generate_name() for _ in range(num_snakes)]
+        for i in range(num_snakes):
             snake = self.create_snake(self.snake_colors[i], self.snake_names[i])
             self.snakes.append(snake)
         
-        # Initialize food items
+        # Initialize food items (also bucketed by the monitor they appear on)
         self.food_items = []
-        self.spawn_initial_food(NUM_FOOD)
+        self._food_by_pos = {}  # (x, y) -> Food, for O(1) eat checks
+        
+        # Obstacle grid for the snake AI (same layout as _occ), refilled for each
+        # snake in update() instead of reallocated
+        self._obstacles_buf = bytearray(len(self._occ))
+        self.foods_by_monitor = [[] for _ in self.monitors]
+        self.spawn_initial_food(num_food)
         
         # Score display (retro style)
         self.font = pygame.font.Font(None, 36)
+        self._text_cache = {}  # (text, color) -> rendered Surface
         
-        # Load config to check if leaderboard should be shown
-        from retro_snake.config import load_config
-        config = load_config()
+        # Check if leaderboard should be shown
         self.show_leaderboard = config.get('show_leaderboard', True)
         
         # Transparent mode settings
@@ -188,8 +272,22 @@ class ScreenSaver:
         if self.transparent_mode and self.desktop_screenshot_pil:
             self._setup_transparent_mode()
         
+        # Static grid overlay for normal mode, drawn once and blitted each frame
+        self._grid_overlay = None
+        if self.desktop_background is None:
+            self._grid_overlay = self._create_grid_overlay()
+        
+        # Dirty-rect presentation for normal mode: only cells that changed since
+        # the last frame are pushed to the display (the first frame is a full flip)
+        self._full_flip = True
+        self._prev_dirty = []
+        self._pending_dirty = []  # Bodies of snakes that died since the last draw
+        self._star_rects = [(x, y, 1, 1) for x, y in zip(self.starfield.xs, self.starfield.ys)]
+        
         # Death animations - list of active animations
-        self.death_animations = []  # List of {'snake_index': i, 'segments': [...], 'timer': 0, 'color': color}
+        self.death_animations = []  # List of DeathAnimation
+        # Reusable particle surfaces, one per pixel size (1-8), refilled per particle
+        self._particle_scratch = [pygame.Surface((s, s), pygame.SRCALPHA) for s in range(1, 9)]
         
         # Track mouse position for exit detection
         self.initial_mouse_pos = pygame.mouse.get_pos()
@@ -230,20 +328,39 @@ class ScreenSaver:
                 # in screen coordinates. PIL's grab(all_screens=True) captures from the 
                 # top-left of the virtual desktop which may have negative coordinates
                 
-                # For simplicity, resize to fit our window
-                pil_image = pil_image.resize((self.virtual_width, self.virtual_height))
-            
-            # Convert to pygame surface
-            mode = pil_image.mode
-            size = pil_image.size
-            data = pil_image.tobytes()
-            
-            self.desktop_background = pygame.image.fromstring(data, size, mode)
+                # For simplicity, resize to fit our window (done below with
+                # smoothscale once the image is a pygame surface)
+                target_size = (self.virtual_width, self.virtual_height)
+            else:
+                target_size = None
+            
+            # Convert to pygame surface: wrap the raw BGRA bytes in place (matches the
+            # usual display pixel order) instead of copying them through fromstring.
+            # frombuffer shares `data`, which stays alive until convert() copies it
+            # into the display format, so the per-frame blit is a plain copy
+            if pil_image.mode != 'RGBA':
+                pil_image = pil_image.convert('RGBA')
+            data = pil_image.tobytes('raw', 'BGRA')
+            surface = pygame.image.frombuffer(data, pil_image.size, 'BGRA')
+            if target_size is not None and target_size != pil_image.size:
+                surface = pygame.transform.smoothscale(surface, target_size)
+            self.desktop_background = surface.convert(self.screen)
             
             # Create trail surface for accumulating black trails
-            self.trail_surface = pygame.Surface((self.virtual_width, self.virtual_height), pygame.SRCALPHA)
+            self.trail_surface = pygame.Surface((self.virtual_width, self.virtual_height), pygame.SRCALPHA).convert_alpha()
             self.trail_surface.fill((0, 0, 0, 0))  # Start fully transparent
             
+            # Persistent trail stamp (one cell, pre-filled with the trail alpha)
+            # Higher darkness = more opaque trails = faster/darker coverage
+            # Scale from 1-20 to 13-255 alpha (at max setting, trails are fully black)
+            self._trail_alpha = min(255, int(13 * self.trail_darkness))  # 13-260, clamped to 255
+            self._trail_stamp = pygame.Surface((constants.CELL_SIZE, constants.CELL_SIZE), pygame.SRCALPHA)
+            self._trail_stamp.fill((0, 0, 0, self._trail_alpha))
+            
+            # Trail alpha per grid cell, mirroring trail_surface so saturated cells
+            # can be skipped without reading pixels back
+            self._trail_levels = bytearray(constants.GRID_WIDTH * constants.GRID_HEIGHT)
+            
             print(f"Transparent mode initialized: {self.virtual_width}x{self.virtual_height}")
         except Exception as e:
             print(f"Failed to setup transparent mode: {e}")
@@ -251,6 +368,19 @@ class ScreenSaver:
             self.desktop_background = None
             self.trail_surface = None
     
+    def _create_grid_overlay(self):
+        """Render the subtle grid lines onto a colorkeyed full-screen surface"""
+        # The lines are opaque, so an opaque surface with black keyed out (RLE-encoded,
+        # so blits skip the empty runs) beats a per-pixel-alpha overlay by far
+        overlay = pygame.Surface((self.virtual_width, self.virtual_height)).convert()
+        overlay.fill(constants.BLACK)
+        overlay.set_colorkey(constants.BLACK, pygame.RLEACCEL)
+        for x in range(0, self.virtual_width, constants.CELL_SIZE * 5):
+            pygame.draw.line(overlay, (8, 8, 12), (x, 0), (x, self.virtual_height))
+        for y in range(0, self.virtual_height, constants.CELL_SIZE * 5):
+            pygame.draw.line(overlay, (8, 8, 12), (0, y), (self.virtual_width, y))
+        return overlay
+    
     def _draw_trail_at_position(self, x, y, size):
         """Add a black trail mark at the given pixel position"""
         if self.trail_surface is not None:
@@ -258,11 +388,6 @@ class ScreenSaver:
             if self.trail_darkness <= 0:
                 return
             
-            # Higher darkness = more opaque trails = faster/darker coverage
-            # Scale from 1-20 to 13-255 alpha (at max setting, trails are fully black)
-            alpha = int(13 * self.trail_darkness)  # 13-260, clamped to 255
-            alpha = min(255, alpha)
-            
             left = max(0, x - size // 2)
             top = max(0, y - size // 2)
             width = min(self.virtual_width - left, size)
@@ -271,17 +396,30 @@ class ScreenSaver:
             if width <= 0 or height <= 0:
                 return
             
+            # Trail alpha already laid down on this cell; once a cell can't change
+            # any more the blit is skipped
+            cell = constants.CELL_SIZE
+            levels = self._trail_levels
+            index = (top // cell) * constants.GRID_WIDTH + left // cell
+            level = levels[index]
+            
             if self.accumulative_trails:
+                if level == 255:
+                    return  # Fully black already
                 # Accumulative mode: use BLEND_RGBA_ADD to add alpha values
                 # Each pass increases the alpha, making trails darker
                 # Alpha automatically clamps at 255 (full black)
-                temp_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-                temp_surf.fill((0, 0, 0, alpha))
-                self.trail_surface.blit(temp_surf, (left, top), special_flags=pygame.BLEND_RGBA_ADD)
+                # The stamp is one cell; size never exceeds CELL_SIZE
+                self.trail_surface.blit(self._trail_stamp, (left, top), (0, 0, width, height),
+                                        special_flags=pygame.BLEND_RGBA_ADD)
+                levels[index] = min(255, level + self._trail_alpha)
             else:
+                if level:
+                    return  # Fixed alpha already drawn here
                 # Non-accumulative: just draw fixed alpha (won't get darker on repeat passes)
                 trail_rect = pygame.Rect(left, top, width, height)
-                pygame.draw.rect(self.trail_surface, (0, 0, 0, alpha), trail_rect)
+                pygame.draw.rect(self.trail_surface, (0, 0, 0, self._trail_alpha), trail_rect)
+                levels[index] = self._trail_alpha
     
     def generate_unique_colors(self, count):
         """Generate unique, maximally different colors for each snake using HSV"""
@@ -310,15 +448,9 @@ class ScreenSaver:
         start_x = random.randint(10, constants.GRID_WIDTH - 10)
         start_y = random.randint(10, constants.GRID_HEIGHT - 10)
         snake = Snake(start_x, start_y, color, name)
-        # Load starting length from config
-        from retro_snake.config import load_config
-        config = load_config()
-        min_length = config.get('min_starting_length', 4)
-        max_length = config.get('max_starting_length', 4)
-        # Ensure min is not greater than max
-        if min_length > max_length:
-            min_length, max_length = max_length, min_length
-        starting_length = random.randint(min_length, max_length)
+        self._occ[start_y * constants.GRID_WIDTH + start_x] += 1
+        # Starting length from the config cached in __init__
+        starting_length = random.randint(self._min_len, self._max_len)
         for _ in range(starting_length):
             snake.grow(1)
         return snake
@@ -330,20 +462,47 @@ class ScreenSaver:
     
     def spawn_food(self):
         """Spawn a new food item in empty location"""
-        occupied = set()
-        for snake in self.snakes:
-            if snake.alive:
-                occupied.update(snake.get_body_set())
-        occupied.update((f.x, f.y) for f in self.food_items)
-        
-        attempts = 0
-        while attempts < 100:
-            x = random.randint(0, constants.GRID_WIDTH - 1)
-            y = random.randint(0, constants.GRID_HEIGHT - 1)
-            if (x, y) not in occupied:
-                self.food_items.append(Food(x, y))
-                break
-            attempts += 1
+        grid_w = constants.GRID_WIDTH
+        occ = self._occ
+        if self._food_by_pos:
+            # Mark existing food on a copy of the snake grid
+            occ = bytearray(occ)
+            for x, y in self._food_by_pos:
+                occ[y * grid_w + x] = 1
+        
+        # Pick uniformly among the free cells (never fails while one exists)
+        free_cells = list(compress(range(len(occ)), occ.translate(_FREE_CELL_TABLE)))
+        if not free_cells:
+            return
+        cell = random.choice(free_cells)
+        y, x = divmod(cell, grid_w)
+        
+        food = Food(x, y)
+        food.monitor_idx = self.get_monitor_index(x, y)
+        food.index = len(self.food_items)
+        self.food_items.append(food)
+        self._food_by_pos[(x, y)] = food
+        if food.monitor_idx is not None:
+            monitor_foods = self.foods_by_monitor[food.monitor_idx]
+            food.monitor_slot = len(monitor_foods)
+            monitor_foods.append(food)
+    
+    def remove_food(self, food):
+        """Remove an eaten food item"""
+        del self._food_by_pos[(food.x, food.y)]
+        
+        # Food lists are unordered pools: move the last item into the freed slot
+        # instead of shifting everything after it
+        last = self.food_items.pop()
+        if last is not food:
+            self.food_items[food.index] = last
+            last.index = food.index
+        if food.monitor_idx is not None:
+            monitor_foods = self.foods_by_monitor[food.monitor_idx]
+            last = monitor_foods.pop()
+            if last is not food:
+                monitor_foods[food.monitor_slot] = last
+                last.monitor_slot = food.monitor_slot
     
     def handle_events(self):
         """Handle pygame events"""
@@ -366,15 +525,15 @@ class ScreenSaver:
     def start_death_animation(self, snake, snake_index):
         """Start the dissolve death animation for a specific snake"""
         snake.alive = False
-        segments = []
+        anim = DeathAnimation(snake_index, snake.color)
+        
+        # Body segments are darker than the head
+        dark_color = tuple(max(0, c - 40) for c in snake.color)
         
         # Create dissolving particles for each body segment
         for i, (x, y) in enumerate(snake.body):
             # Calculate color (head is brighter)
-            if i == 0:
-                color = snake.color
-            else:
-                color = tuple(max(0, c - 40) for c in snake.color)
+            color = snake.color if i == 0 else dark_color
             
             # Create multiple particles per segment for better effect
             for _ in range(4):
@@ -384,62 +543,46 @@ class ScreenSaver:
                 px = int(x * constants.CELL_SIZE + constants.CELL_SIZE // 2 + random.randint(-5, 5))
                 py = int(y * constants.CELL_SIZE + constants.CELL_SIZE // 2 + random.randint(-5, 5))
                 size = random.randint(3, 8)
-                segments.append({
-                    'x': px, 'y': py,
-                    'vx': vx, 'vy': vy,
-                    'color': color,
-                    'alpha': 255,
-                    'size': size,
-                    'decay': random.uniform(4, 8)
-                })
+                anim.add_particle(px, py, vx, vy, size, random.uniform(4, 8), color)
         
         # Reset the snake's body immediately so leaderboard shows 0 length
+        occ = self._occ
+        grid_w = constants.GRID_WIDTH
+        cell = constants.CELL_SIZE
+        for x, y in snake.body:
+            occ[y * grid_w + x] -= 1
+            self._pending_dirty.append((x * cell, y * cell, cell, cell))
         snake.body.clear()
         snake.score = 0
         
-        self.death_animations.append({
-            'snake_index': snake_index,
-            'segments': segments,
-            'timer': 0,
-            'color': snake.color
-        })
+        self.death_animations.append(anim)
     
     def update_death_animations(self):
         """Update all dissolving particle animations"""
         completed = []
         
         for anim in self.death_animations:
-            anim['timer'] += 1
-            
-            # Update each particle
-            for particle in anim['segments']:
-                particle['x'] += particle['vx']
-                particle['y'] += particle['vy']
-                particle['vy'] += 0.1  # Gravity
-                particle['alpha'] -= particle['decay']
-                particle['size'] = max(1, particle['size'] - 0.1)
-            
-            # Remove dead particles
-            anim['segments'] = [p for p in anim['segments'] if p['alpha'] > 0]
-            
-            # Animation complete when all particles are gone or timeout
-            if len(anim['segments']) == 0 or anim['timer'] > 60:
+            anim.update()
+            if anim.is_finished():
                 completed.append(anim)
         
         # Respawn completed snakes
         for anim in completed:
             self.death_animations.remove(anim)
-            snake_index = anim['snake_index']
+            snake_index = anim.snake_index
             # Respawn with same color and name, reset score
             name = self.snake_names[snake_index] if snake_index < len(self.snake_names) else None
-            self.snakes[snake_index] = self.create_snake(anim['color'], name)
+            self.snakes[snake_index] = self.create_snake(anim.color, name)
     
     def get_all_obstacles(self, exclude_snake_index=None):
-        """Get all obstacle positions (all snake bodies)"""
-        obstacles = set()
-        for i, snake in enumerate(self.snakes):
-            if snake.alive and i != exclude_snake_index:
-                obstacles.update(snake.get_body_set())
+        """Get all obstacle positions (all snake bodies) as an occupancy grid"""
+        obstacles = bytearray(self._occ)
+        if exclude_snake_index is not None:
+            snake = self.snakes[exclude_snake_index]
+            if snake.alive:
+                grid_w = constants.GRID_WIDTH
+                for x, y in snake.body:
+                    obstacles[y * grid_w + x] -= 1
         return obstacles
     
     def update(self):
@@ -449,70 +592,64 @@ class ScreenSaver:
         
         # Update food pulse timers
         for food in self.food_items:
-            food.pulse_timer += 0.15
+            food.pulse_timer += 1
         
         # Update death animations
         if self.death_animations:
             self.update_death_animations()
         
-        # First pass: collect all snake info for prediction
-        snake_info = []
-        for i, snake in enumerate(self.snakes):
+        # Locals for the per-snake loops below
+        occ = self._occ
+        grid_w = constants.GRID_WIDTH
+        grid_h = constants.GRID_HEIGHT
+        snakes = self.snakes
+        food_by_pos = self._food_by_pos
+        obstacles = self._obstacles_buf
+        
+        # First pass: collect every alive snake's (head_x, head_y, dir_x, dir_y)
+        # once per tick for proximity checking (suggestion #4). Each snake's own
+        # entry is harmless there - it sits at distance 0 and can only move away -
+        # so the same list is shared by all snakes without filtering
+        snake_heads = []
+        for snake in snakes:
             if snake.alive:
-                snake_info.append({
-                    'index': i,
-                    'head': snake.get_head(),
-                    'direction': snake.direction,
-                    'body_set': snake.get_body_set()
-                })
+                head_x, head_y = snake.get_head()
+                dx, dy = snake.direction.value
+                snake_heads.append((head_x, head_y, dx, dy))
         
         # Update each alive snake
-        for i, snake in enumerate(self.snakes):
+        for i, snake in enumerate(snakes):
             if not snake.alive:
                 continue
             
-            # Get all obstacles (own body + other snakes' current positions + predicted next positions)
-            obstacles = snake.get_body_set()  # Own body
+            # Current obstacles (own body + other snakes' current positions) are
+            # exactly the occupied cells of the occupancy grid
+            current_obstacles = occ
             
-            # Add other snakes' current positions
-            for j, other_snake in enumerate(self.snakes):
+            # All obstacles for the AI: current positions + predicted next positions
+            obstacles[:] = occ
+            for j, other_snake in enumerate(snakes):
                 if j != i and other_snake.alive:
-                    obstacles.update(other_snake.get_body_set())
-                    
                     # PREDICT other snakes' next positions (suggestion #1)
                     other_head = other_snake.get_head()
                     other_dx, other_dy = other_snake.direction.value
-                    predicted_next_x = (other_head[0] + other_dx) % constants.GRID_WIDTH
-                    predicted_next_y = (other_head[1] + other_dy) % constants.GRID_HEIGHT
-                    obstacles.add((predicted_next_x, predicted_next_y))
-            
-            # Build other snakes info for proximity checking (suggestion #4)
-            other_snakes_info = []
-            for info in snake_info:
-                if info['index'] != i:
-                    other_snakes_info.append({
-                        'head': info['head'],
-                        'direction': info['direction'],
-                        'body_set': info['body_set']
-                    })
-            
-            # AI chooses direction (with other snakes info for proximity check)
-            snake.choose_direction(obstacles, other_snakes_info)
+                    predicted_next_x = (other_head[0] + other_dx) % grid_w
+                    predicted_next_y = (other_head[1] + other_dy) % grid_h
+                    obstacles[predicted_next_y * grid_w + predicted_next_x] = 1
+            
+            # AI chooses direction (with snake heads for proximity check)
+            snake.choose_direction(obstacles, snake_heads)
             
             # FINAL SAFETY CHECK: Re-check if the chosen direction is safe
             # This catches cases where other snakes moved into our path after we decided
-            current_obstacles = snake.get_body_set()
-            for j, other_snake in enumerate(self.snakes):
-                if j != i and other_snake.alive:
-                    current_obstacles.update(other_snake.get_body_set())
             
             # Check if the next position is actually safe right now
             head_x, head_y = snake.get_head()
             dx, dy = snake.direction.value
-            next_x = (head_x + dx) % constants.GRID_WIDTH
-            next_y = (head_y + dy) % constants.GRID_HEIGHT
+            next_x = (head_x + dx) % grid_w
+            next_y = (head_y + dy) % grid_h
             
-            if (next_x, next_y) in current_obstacles:
+            if current_obstacles[next_y * grid_w + next_x]:
                 # Danger! Try to find a safe direction immediately
                 safe_dirs = snake.get_safe_directions(current_obstacles)
                 if safe_dirs:
@@ -527,30 +664,42 @@ class ScreenSaver:
                     if best_dir:
                         snake.direction = best_dir
             
-            # Move snake
-            snake.move()
+            # Move snake (and shift its cells in the occupancy grid)
+            tail = snake.move()
+            head = snake.get_head()
+            occ[head[1] * grid_w + head[0]] += 1
+            if tail is not None:
+                occ[tail[1] * grid_w + tail[0]] -= 1
             
             # Check for food collision
-            head = snake.get_head()
-            for food in self.food_items[:]:
-                if food.get_pos() == head:
-                    snake.grow(3)
-                    self.food_items.remove(food)
-                    self.spawn_food()
-                    snake.score += 10
+            food = food_by_pos.get(head)
+            if food is not None:
+                snake.grow(3)
+                self.remove_food(food)
+                self.spawn_food()
+                snake.score += 10
             
             # Check for self collision
             if snake.check_self_collision():
                 self.start_death_animation(snake, i)
                 continue
             
-            # Check for collision with other snakes (head hitting any body)
-            for j, other_snake in enumerate(self.snakes):
-                if j != i and other_snake.alive:
-                    # Check if this snake's head hit the other snake's body
-                    if head in other_snake.get_body_set():
-                        self.start_death_animation(snake, i)
-                        break
+            # Check for collision with other snakes (head hitting any body) -
+            # anything on the head cell besides the head itself is another snake
+            if occ[head[1] * grid_w + head[0]] > 1:
+                self.start_death_animation(snake, i)
+    
+    def _rtext(self, text, color):
+        """Render leaderboard text, reusing the surface while the string is unchanged"""
+        key = (text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = self.font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
     
     def grid_to_screen(self, grid_x, grid_y):
         """Convert grid coordinates to screen pixel coordinates"""
@@ -565,8 +714,22 @@ class ScreenSaver:
                 return True
         return False
     
+    def get_monitor_index(self, grid_x, grid_y):
+        """Get the index of the first monitor overlapping a grid cell (None if the cell is off-screen)"""
+        px, py = self.grid_to_screen(grid_x, grid_y)
+        cell = constants.CELL_SIZE
+        for i, monitor in enumerate(self.monitors):
+            mx, my = monitor['x'], monitor['y']
+            if mx - cell < px < mx + monitor['width'] and my - cell < py < my + monitor['height']:
+                return i
+        return None
+    
     def draw(self):
         """Draw everything"""
+        cell = constants.CELL_SIZE
+        snakes = self.snakes
+        dirty = None  # Rects to present, or None for a full flip
+        
         if self.transparent_mode and self.desktop_background is not None:
             # Transparent mode: draw desktop background with accumulated trails
             self.screen.blit(self.desktop_background, (0, 0))
@@ -577,14 +740,12 @@ class ScreenSaver:
             # Add trails only at the tail (last segment) of each snake
             # This way the trail appears behind the snake as it moves away
             # Only draw trails once the snake has finished growing to its initial length
-            for snake in self.snakes:
+            for snake in snakes:
                 if snake.alive and len(snake.body) > 0 and snake.grow_pending == 0:
                     # Get the tail position (last segment)
                     tail_gx, tail_gy = snake.body[-1]
-                    px, py = self.grid_to_screen(tail_gx, tail_gy)
-                    px += constants.CELL_SIZE // 2
-                    py += constants.CELL_SIZE // 2
-                    self._draw_trail_at_position(px, py, constants.CELL_SIZE)
+                    half = cell // 2
+                    self._draw_trail_at_position(tail_gx * cell + half, tail_gy * cell + half, cell)
         else:
             # Normal mode: black background with starfield
             self.screen.fill(constants.BLACK)
@@ -593,38 +754,47 @@ class ScreenSaver:
             self.starfield.draw(self.screen)
             
             # Draw grid lines (very subtle, barely visible)
-            for x in range(0, self.virtual_width, constants.CELL_SIZE * 5):
-                pygame.draw.line(self.screen, (8, 8, 12), (x, 0), (x, self.virtual_height))
-            for y in range(0, self.virtual_height, constants.CELL_SIZE * 5):
-                pygame.draw.line(self.screen, (8, 8, 12), (0, y), (self.virtual_width, y))
+            self.screen.blit(self._grid_overlay, (0, 0))
+            
+            # Twinkling stars change every frame; cleared snake cells must be presented too
+            dirty = self._star_rects + self._pending_dirty
+        self._pending_dirty = []
         
-        # Draw food
-        for food in self.food_items:
-            food.draw(self.screen, self)
+        # Draw food per monitor (food in gaps between monitors is never visible)
+        for monitor_foods in self.foods_by_monitor:
+            draw_foods(self.screen, monitor_foods)
+            if dirty is not None:
+                dirty.extend((f.x * cell, f.y * cell, cell, cell) for f in monitor_foods)
         
         # Draw all alive snakes
-        for snake in self.snakes:
+        for snake in snakes:
             if snake.alive:
                 snake.draw(self.screen, self)
-        
-        # Draw all death animations
+                if dirty is not None and snake.body:
+                    # Between frames only the head, the old head (now the neck) and
+                    # the tail change; the vacated tail is in last frame's rects
+                    body = snake.body
+                    for x, y in (body[0], body[1] if len(body) > 1 else body[0], body[-1]):
+                        dirty.append((x * cell, y * cell, cell, cell))
+        
+        # Draw all death animations (particles fade at their own rates, so batching
+        # by color/alpha barely merges any - a fill and blit per particle is cheaper)
+        scratch = self._particle_scratch
+        blit = self.screen.blit
         for anim in self.death_animations:
-            for particle in anim['segments']:
-                if particle['alpha'] > 0:
-                    px, py = int(particle['x']), int(particle['y'])
-                    size = int(particle['size'])
-                    surf = pygame.Surface((size, size), pygame.SRCALPHA)
-                    alpha = int(particle['alpha'])
-                    color_with_alpha = (*particle['color'], alpha)
-                    surf.fill(color_with_alpha)
-                    self.screen.blit(surf, (px, py))
+            for x, y, size, alpha, color in zip(anim.xs, anim.ys, anim.sizes, anim.alphas, anim.colors):
+                surf = scratch[int(size) - 1]
+                surf.fill((*color, int(alpha)))
+                rect = blit(surf, (int(x), int(y)))
+                if dirty is not None:
+                    dirty.append(rect)
         
         # Draw scores for each snake (in their color), sorted by length descending
         # Only draw if show_leaderboard is enabled
         if self.show_leaderboard:
             y_offset = 10
             # Sort snakes by length (descending) for leaderboard
-            sorted_snakes = sorted(enumerate(self.snakes), key=lambda x: len(x[1].body), reverse=True)
+            sorted_snakes = sorted(enumerate(snakes), key=lambda x: len(x[1].body), reverse=True)
             
             for rank, (i, snake) in enumerate(sorted_snakes):
                 # Create darker version of snake color for shadow
@@ -633,13 +803,20 @@ class ScreenSaver:
                 # Show name and length
                 name = snake.name if snake.name else f"Snake {i+1}"
                 display_text = f"{name}: {len(snake.body)}"
-                score_text = self.font.render(display_text, True, snake.color)
-                shadow_text = self.font.render(display_text, True, shadow_color)
-                self.screen.blit(shadow_text, (12, y_offset + 2))
-                self.screen.blit(score_text, (10, y_offset))
+                score_text = self._rtext(display_text, snake.color)
+                shadow_text = self._rtext(display_text, shadow_color)
+                shadow_rect = self.screen.blit(shadow_text, (12, y_offset + 2))
+                text_rect = self.screen.blit(score_text, (10, y_offset))
+                if dirty is not None:
+                    dirty.append(shadow_rect.union(text_rect))
                 y_offset += 30
         
-        pygame.display.flip()
+        if dirty is None or self._full_flip:
+            pygame.display.flip()
+            self._full_flip = False
+        else:
+            pygame.display.update(dirty + self._prev_dirty)
+        self._prev_dirty = dirty or []
     
     def run(self):
         """Main loop"""
@@ -5,13 +5,134 @@ Snake class with AI logic for Retro Snake Screensaver
 import pygame
 import random
 from collections import deque
+from itertools import islice
 from retro_snake import constants
 from retro_snake.config import DODGE_CHANCE
 
+# Eye positions inside the head cell for each heading
+EYE_SIZE = 3
+_EYE_OFFSETS = {
+    constants.Direction.RIGHT: ((12, 4), (12, 12)),
+    constants.Direction.LEFT: ((4, 4), (4, 12)),
+    constants.Direction.UP: ((4, 4), (12, 4)),
+    constants.Direction.DOWN: ((4, 12), (12, 12)),
+}
+
+# Reverse of each direction, and the three directions allowed from each heading
+_OPPOSITE = {
+    constants.Direction.UP: constants.Direction.DOWN,
+    constants.Direction.DOWN: constants.Direction.UP,
+    constants.Direction.LEFT: constants.Direction.RIGHT,
+    constants.Direction.RIGHT: constants.Direction.LEFT
+}
+_ALLOWED = {d: tuple(x for x in constants.Direction if x is not _OPPOSITE[d]) for d in constants.Direction}
+
+# Direction sets as 4-bit masks (bit i = i-th Direction): per-direction bit and step
+# vector (avoiding the enum's .value property), the steps allowed from each heading,
+# and the directions in each mask, in Direction order
+_DIRECTIONS = tuple(constants.Direction)
+_DIR_BIT = {d: 1 << i for i, d in enumerate(_DIRECTIONS)}
+_DIR_VEC = {d: d.value for d in _DIRECTIONS}
+_ALLOWED_STEPS = {d: tuple((x, _DIR_BIT[x]) + x.value for x in _ALLOWED[d]) for d in _DIRECTIONS}
+_ALLOWED_MASK = {d: sum(_DIR_BIT[x] for x in _ALLOWED[d]) for d in _DIRECTIONS}
+_MASK_DIRS = tuple(tuple(d for d in _DIRECTIONS if mask & _DIR_BIT[d]) for mask in range(1 << len(_DIRECTIONS)))
+
+# Pre-rendered segment tiles keyed by (color, cell_size)
+_tile_cache = {}
+
+
+def get_snake_tiles(color):
+    """Get the cached (body_tile, {direction: head_tile}) surfaces for a snake color"""
+    key = (color, constants.CELL_SIZE)
+    tiles = _tile_cache.get(key)
+    if tiles is None:
+        # One pixel smaller than a cell, leaving the gap between segments untouched
+        size = constants.CELL_SIZE - 1
+        
+        # Body segments - slightly darker for depth effect, with an inner
+        # highlight for retro 3D effect
+        body_tile = pygame.Surface((size, size))
+        body_tile.fill(tuple(max(0, c - 40) for c in color))
+        body_tile.fill(color, (2, 2, size - 4, size - 4))
+        
+        # Head - brighter, with eyes facing the direction of travel
+        head_tiles = {}
+        for direction, eyes in _EYE_OFFSETS.items():
+            head_tile = pygame.Surface((size, size))
+            head_tile.fill(color)
+            for ox, oy in eyes:
+                head_tile.fill(constants.BLACK, (ox, oy, EYE_SIZE, EYE_SIZE))
+            head_tiles[direction] = head_tile
+        
+        tiles = _tile_cache[key] = (body_tile, head_tiles)
+    return tiles
+
+
+# Single-step wrap tables keyed by grid size
+_wrap_cache = {}
+
+
+def _wrap_tables(grid_w, grid_h):
+    """Get (wrap_x, wrap_y) lookup tables: wrap_x[x + 1] is x wrapped, for x in -1..grid_w"""
+    tables = _wrap_cache.get((grid_w, grid_h))
+    if tables is None:
+        tables = _wrap_cache[(grid_w, grid_h)] = (
+            tuple((i - 1) % grid_w for i in range(grid_w + 2)),
+            tuple((i - 1) % grid_h for i in range(grid_h + 2)),
+        )
+    return tables
+
+
+def _count_free_cells(obstacles, x, y, dx, dy, grid_w, grid_h, depth):
+    """Count the free cells stepping from (x, y) by (dx, dy) before the first obstacle"""
+    end_x = x + dx * depth
+    end_y = y + dy * depth
+    if depth > 0 and 0 <= end_x < grid_w and 0 <= end_y < grid_h:
+        # The ray never wraps, so it is a strided slice of the flat grid and the
+        # free run is its leading zero bytes - no per-step modulo or indexing
+        step = dy * grid_w + dx
+        stop = (end_y * grid_w + end_x) + step
+        ray = obstacles[y * grid_w + x + step:stop if stop >= 0 else None:step]
+        return depth - len(ray.lstrip(b'\0'))
+    
+    wrap_x, wrap_y = _wrap_tables(grid_w, grid_h)
+    dx += 1  # Tables are offset by one
+    dy += 1
+    safe_count = 0
+    for _ in range(depth):
+        x = wrap_x[x + dx]
+        y = wrap_y[y + dy]
+        if obstacles[y * grid_w + x]:
+            break
+        safe_count += 1
+    return safe_count
+
+
+def _toroidal_cheb(ax, ay, bx, by, grid_w, grid_h):
+    """Chebyshev distance between two cells on the wrapping grid"""
+    dx = (bx - ax) % grid_w
+    if dx > grid_w >> 1:
+        dx = grid_w - dx
+    dy = (by - ay) % grid_h
+    if dy > grid_h >> 1:
+        dy = grid_h - dy
+    return dx if dx > dy else dy
+
+
+def _is_approaching(my_x, my_y, other_x, other_y, other_dx, other_dy, grid_w, grid_h, threshold):
+    """Check if a head within threshold (toroidal Chebyshev distance) is moving closer"""
+    distance = _toroidal_cheb(my_x, my_y, other_x, other_y, grid_w, grid_h)
+    if distance > threshold:
+        return False
+    
+    # Distance after the other snake moves (the modulo in the helper wraps the step)
+    return _toroidal_cheb(my_x, my_y, other_x + other_dx, other_y + other_dy, grid_w, grid_h) < distance
+
 
 class Snake:
     def __init__(self, start_x, start_y, color, name=None):
         self.body = deque([(start_x, start_y)])
+        self._body_set = {(start_x, start_y)}  # Cells in body, kept in sync by move()
         self.direction = random.choice(list(constants.Direction))
         self.color = color
         self.name = name  # Name for this snake
@@ -27,7 +148,8 @@ class Snake:
         return self.body[0]
     
     def get_body_set(self):
-        return set(self.body)
+        """Cells occupied by the body (a live set owned by the snake - copy before mutating)"""
+        return self._body_set
     
     def can_turn(self):
         """Check if enough time has passed for a turn"""
@@ -38,190 +160,169 @@ class Snake:
         self.turn_interval = random.randint(self.min_turn_interval, self.max_turn_interval)
     
     def get_possible_directions(self):
-        """Get directions that won't cause immediate reversal"""
-        opposite = {
-            constants.Direction.UP: constants.Direction.DOWN,
-            constants.Direction.DOWN: constants.Direction.UP,
-            constants.Direction.LEFT: constants.Direction.RIGHT,
-            constants.Direction.RIGHT: constants.Direction.LEFT
-        }
-        return [d for d in constants.Direction if d != opposite[self.direction]]
+        """Get directions that won't cause immediate reversal (a shared tuple - don't mutate)"""
+        return _ALLOWED[self.direction]
     
-    def get_safe_directions(self, obstacles):
-        """Get directions that won't cause collision in next move"""
+    def get_safe_mask(self, obstacles):
+        """Get the directions that won't cause collision in next move as a bitmask
+        obstacles: occupancy grid (bytearray indexed y * GRID_WIDTH + x, nonzero = blocked)
+        """
         head_x, head_y = self.get_head()
-        safe = []
+        grid_w = constants.GRID_WIDTH
+        wrap_x, wrap_y = _wrap_tables(grid_w, constants.GRID_HEIGHT)
+        mask = 0
         
-        for direction in self.get_possible_directions():
-            dx, dy = direction.value
-            new_x = (head_x + dx) % constants.GRID_WIDTH
-            new_y = (head_y + dy) % constants.GRID_HEIGHT
+        for direction, bit, dx, dy in _ALLOWED_STEPS[self.direction]:
+            new_x = wrap_x[head_x + dx + 1]
+            new_y = wrap_y[head_y + dy + 1]
             
             # Check if this position is safe (not in obstacles)
-            if (new_x, new_y) not in obstacles:
-                safe.append(direction)
+            if not obstacles[new_y * grid_w + new_x]:
+                mask |= bit
         
-        return safe
+        return mask
+    
+    def get_safe_directions(self, obstacles):
+        """Get directions that won't cause collision in next move (a shared tuple)"""
+        return _MASK_DIRS[self.get_safe_mask(obstacles)]
     
     def look_ahead(self, direction, obstacles, depth=5):
-        """Look ahead to see how many safe moves in a direction"""
+        """Look ahead to see how many safe moves in a direction
+        obstacles: occupancy grid as for get_safe_directions, including our own body
+        """
         head_x, head_y = self.get_head()
-        dx, dy = direction.value
-        safe_count = 0
-        
-        # Create a copy of body positions for simulation
-        simulated_body = set(self.body)
-        
-        for i in range(depth):
-            head_x = (head_x + dx) % constants.GRID_WIDTH
-            head_y = (head_y + dy) % constants.GRID_HEIGHT
-            
-            if (head_x, head_y) in obstacles or (head_x, head_y) in simulated_body:
-                break
-            safe_count += 1
-        
-        return safe_count
+        dx, dy = _DIR_VEC[direction]
+        return _count_free_cells(obstacles, head_x, head_y, dx, dy,
+                                 constants.GRID_WIDTH, constants.GRID_HEIGHT, depth)
     
     def check_approaching_snakes(self, other_snakes_info, proximity_threshold=3):
         """Check if any other snake's head is nearby and moving toward this snake
-        other_snakes_info: list of dicts with 'head', 'direction', 'body_set' keys
+        other_snakes_info: list of (head_x, head_y, dir_x, dir_y) tuples; may include
+        this snake's own entry, which never counts as approaching
         Returns True if an approaching snake is detected
         """
-        my_head = self.get_head()
-        my_x, my_y = my_head
+        my_x, my_y = self.get_head()
+        grid_w = constants.GRID_WIDTH
+        grid_h = constants.GRID_HEIGHT
         
-        for other_info in other_snakes_info:
-            other_head = other_info['head']
-            other_dir = other_info['direction']
-            other_x, other_y = other_head
-            
-            # Calculate distance (accounting for toroidal wrapping)
-            dx = min(abs(other_x - my_x), constants.GRID_WIDTH - abs(other_x - my_x))
-            dy = min(abs(other_y - my_y), constants.GRID_HEIGHT - abs(other_y - my_y))
-            distance = max(dx, dy)  # Chebyshev distance (max of x and y)
-            
-            if distance <= proximity_threshold:
-                # Check if other snake is moving toward this snake
-                other_dx, other_dy = other_dir.value
-                other_next_x = (other_x + other_dx) % constants.GRID_WIDTH
-                other_next_y = (other_y + other_dy) % constants.GRID_HEIGHT
-                
-                # Calculate distance after other snake moves
-                next_dx = min(abs(other_next_x - my_x), constants.GRID_WIDTH - abs(other_next_x - my_x))
-                next_dy = min(abs(other_next_y - my_y), constants.GRID_HEIGHT - abs(other_next_y - my_y))
-                next_distance = max(next_dx, next_dy)
-                
-                # If distance is decreasing, snake is approaching
-                if next_distance < distance:
-                    return True
+        for other_x, other_y, other_dx, other_dy in other_snakes_info:
+            if _is_approaching(my_x, my_y, other_x, other_y, other_dx, other_dy,
+                               grid_w, grid_h, proximity_threshold):
+                return True
         
         return False
     
+    def _pick_best_direction(self, directions, obstacles, known_score=None):
+        """Pick a direction with the most open cells ahead (depth 8), ties broken uniformly
+        known_score: optional (direction, score) already looked ahead to depth 8
+        """
+        if len(directions) == 1:
+            return directions[0]  # No choice to make, skip the look-ahead
+        
+        # Single-pass reservoir sample over the tied best directions
+        best_dir = None
+        best_score = -1
+        ties = 0
+        for d in directions:
+            if known_score is not None and d is known_score[0]:
+                score = known_score[1]
+            else:
+                score = self.look_ahead(d, obstacles, depth=8)
+            if score > best_score:
+                best_score = score
+                best_dir = d
+                ties = 1
+            elif score == best_score:
+                ties += 1
+                if random.random() * ties < 1:
+                    best_dir = d
+        return best_dir
+    
     def choose_direction(self, obstacles, other_snakes_info=None):
         """AI decision making for direction
-        other_snakes_info: optional list of dicts with 'head', 'direction', 'body_set' keys for proximity checking
+        obstacles: occupancy grid as for get_safe_directions, including our own body
+        other_snakes_info: optional list of (head_x, head_y, dir_x, dir_y) tuples for proximity checking
         """
         self.turn_timer += 1
         
         # Get currently safe directions
-        safe_directions = self.get_safe_directions(obstacles)
+        safe_mask = self.get_safe_mask(obstacles)
         
-        if not safe_directions:
+        if not safe_mask:
             # No safe direction - try any non-reversing direction
-            safe_directions = self.get_possible_directions()
+            safe_mask = _ALLOWED_MASK[self.direction]
+        safe_directions = _MASK_DIRS[safe_mask]
+        current_is_safe = safe_mask & _DIR_BIT[self.direction]
         
         # Check for approaching snakes (proximity check)
         approaching_danger = False
         if other_snakes_info:
             approaching_danger = self.check_approaching_snakes(other_snakes_info, proximity_threshold=3)
         
-        # Check if look-ahead detects collision in current direction
+        # Check if look-ahead detects collision in current direction. One depth-8
+        # walk serves both this danger test and the scoring below: a walk stopped
+        # short at depth 8 would have stopped at the same cell at depth 5
         look_ahead_danger = False
-        if self.direction in safe_directions:
-            look_ahead_score = self.look_ahead(self.direction, obstacles, depth=5)
+        known_score = None
+        if current_is_safe:
+            look_ahead_score = self.look_ahead(self.direction, obstacles, depth=8)
+            known_score = (self.direction, look_ahead_score)
             # If look-ahead finds very few safe moves, there's danger ahead
             if look_ahead_score < 3:
                 look_ahead_danger = True
         
         # Current direction is still valid?
-        if self.direction in safe_directions:
+        if current_is_safe:
             # Check if we should dodge due to approaching snake or look-ahead danger
             should_dodge = approaching_danger or look_ahead_danger
             
             if should_dodge and self.can_turn():
                 # Force a dodge - evaluate all safe directions
-                best_directions = []
-                best_score = -1
-                
-                for d in safe_directions:
-                    score = self.look_ahead(d, obstacles, depth=8)
-                    if score > best_score:
-                        best_score = score
-                        best_directions = [d]
-                    elif score == best_score:
-                        best_directions.append(d)
-                
-                if best_directions:
-                    new_direction = random.choice(best_directions)
-                    if new_direction != self.direction:
-                        self.reset_turn_timer()
-                    self.direction = new_direction
+                new_direction = self._pick_best_direction(safe_directions, obstacles, known_score)
+                if new_direction != self.direction:
+                    self.reset_turn_timer()
+                self.direction = new_direction
             # Only consider turning if timer allows (normal behavior)
             elif self.can_turn():
                 # Sometimes turn randomly, sometimes continue
                 if random.random() < 0.3:  # 30% chance to turn when timer allows
                     # Evaluate all safe directions
-                    best_directions = []
-                    best_score = -1
-                    
-                    for d in safe_directions:
-                        score = self.look_ahead(d, obstacles, depth=8)
-                        if score > best_score:
-                            best_score = score
-                            best_directions = [d]
-                        elif score == best_score:
-                            best_directions.append(d)
-                    
-                    if best_directions:
-                        new_direction = random.choice(best_directions)
-                        if new_direction != self.direction:
-                            self.reset_turn_timer()
-                        self.direction = new_direction
+                    new_direction = self._pick_best_direction(safe_directions, obstacles, known_score)
+                    if new_direction != self.direction:
+                        self.reset_turn_timer()
+                    self.direction = new_direction
             # Else keep going straight
         else:
             # Must turn - choose best safe direction
+            # (the dodge roll comes first so a snake that crashes anyway skips the scoring)
             if safe_directions:
-                best_directions = []
-                best_score = -1
-                
-                for d in safe_directions:
-                    score = self.look_ahead(d, obstacles, depth=8)
-                    if score > best_score:
-                        best_score = score
-                        best_directions = [d]
-                    elif score == best_score:
-                        best_directions.append(d)
-                
                 # 50% chance to actually dodge, 50% chance to crash anyway
                 if random.random() < DODGE_CHANCE:
-                    self.direction = random.choice(best_directions) if best_directions else random.choice(safe_directions)
+                    self.direction = self._pick_best_direction(safe_directions, obstacles)
                     self.reset_turn_timer()
                 # else: keep going straight into danger!
     
     def move(self):
-        """Move the snake in current direction"""
+        """Move the snake in current direction
+        Returns the vacated tail cell, or None while the snake is growing
+        """
         head_x, head_y = self.get_head()
-        dx, dy = self.direction.value
+        dx, dy = _DIR_VEC[self.direction]
         
         # Wrap around screen (toroidal)
-        new_head = ((head_x + dx) % constants.GRID_WIDTH, (head_y + dy) % constants.GRID_HEIGHT)
+        wrap_x, wrap_y = _wrap_tables(constants.GRID_WIDTH, constants.GRID_HEIGHT)
+        new_head = (wrap_x[head_x + dx + 1], wrap_y[head_y + dy + 1])
         
         self.body.appendleft(new_head)
+        self._body_set.add(new_head)
         
         if self.grow_pending > 0:
             self.grow_pending -= 1
-        else:
-            self.body.pop()
+            return None
+        tail = self.body.pop()
+        if tail != new_head:  # Chasing our own tail leaves the cell occupied
+            self._body_set.discard(tail)
+        return tail
     
     def grow(self, amount=3):
         """Schedule growth"""
@@ -229,87 +330,40 @@ class Snake:
     
     def check_self_collision(self):
         """Check if head collides with body"""
-        head = self.get_head()
-        body_without_head = list(self.body)[1:]
-        return head in body_without_head
+        # Body cells are distinct while alive, so after a move the head overlaps
+        # another segment exactly when the set holds fewer cells than the body
+        return len(self._body_set) < len(self.body)
     
     def draw(self, surface, screen_saver=None):
         """Draw the snake with retro style"""
-        for i, (x, y) in enumerate(self.body):
-            px, py = x * constants.CELL_SIZE, y * constants.CELL_SIZE
-            rect = pygame.Rect(px, py, constants.CELL_SIZE - 1, constants.CELL_SIZE - 1)
-            
-            if i == 0:
-                # Head - brighter
-                pygame.draw.rect(surface, self.color, rect)
-                # Eyes
-                eye_color = constants.BLACK
-                eye_size = 3
-                dx, dy = self.direction.value
-                
-                if self.direction == constants.Direction.RIGHT:
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 12, y * constants.CELL_SIZE + 4, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 12, y * constants.CELL_SIZE + 12, eye_size, eye_size))
-                elif self.direction == constants.Direction.LEFT:
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 4, y * constants.CELL_SIZE + 4, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 4, y * constants.CELL_SIZE + 12, eye_size, eye_size))
-                elif self.direction == constants.Direction.UP:
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 4, y * constants.CELL_SIZE + 4, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 12, y * constants.CELL_SIZE + 4, eye_size, eye_size))
-                else:  # DOWN
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 4, y * constants.CELL_SIZE + 12, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (x * constants.CELL_SIZE + 12, y * constants.CELL_SIZE + 12, eye_size, eye_size))
-            else:
-                # Body segments - slightly darker for depth effect
-                segment_color = tuple(max(0, c - 40) for c in self.color)
-                pygame.draw.rect(surface, segment_color, rect)
-                # Inner highlight for retro 3D effect
-                inner_rect = pygame.Rect(x * constants.CELL_SIZE + 2, y * constants.CELL_SIZE + 2, constants.CELL_SIZE - 5, constants.CELL_SIZE - 5)
-                pygame.draw.rect(surface, self.color, inner_rect)
+        cell = constants.CELL_SIZE
+        body_tile, head_tiles = get_snake_tiles(self.color)
+        body = self.body
+        if not body:
+            return
+        
+        head_x, head_y = body[0]
+        surface.blit(head_tiles[self.direction], (head_x * cell, head_y * cell))
+        surface.blits([(body_tile, (x * cell, y * cell)) for x, y in islice(body, 1, None)],
+                      doreturn=False)
     
     def draw_on_monitor(self, surface, monitor):
         """Draw the snake segments that are visible on a specific monitor"""
+        cell = constants.CELL_SIZE
+        body_tile, head_tiles = get_snake_tiles(self.color)
         mon_x = monitor['x']
         mon_y = monitor['y']
         mon_w = monitor['width']
         mon_h = monitor['height']
         
+        blit_list = []
         for i, (x, y) in enumerate(self.body):
-            px, py = x * constants.CELL_SIZE, y * constants.CELL_SIZE
+            px, py = x * cell, y * cell
             # Check if this segment is visible on this monitor
             if not (mon_x <= px < mon_x + mon_w and mon_y <= py < mon_y + mon_h):
                 continue
             
             # Convert to monitor-local coordinates
-            local_x = px - mon_x
-            local_y = py - mon_y
-            rect = pygame.Rect(local_x, local_y, constants.CELL_SIZE - 1, constants.CELL_SIZE - 1)
-            
-            if i == 0:
-                # Head - brighter
-                pygame.draw.rect(surface, self.color, rect)
-                # Eyes
-                eye_color = constants.BLACK
-                eye_size = 3
-                dx, dy = self.direction.value
-                
-                if self.direction == constants.Direction.RIGHT:
-                    pygame.draw.rect(surface, eye_color, (local_x + 12, local_y + 4, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (local_x + 12, local_y + 12, eye_size, eye_size))
-                elif self.direction == constants.Direction.LEFT:
-                    pygame.draw.rect(surface, eye_color, (local_x + 4, local_y + 4, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (local_x + 4, local_y + 12, eye_size, eye_size))
-                elif self.direction == constants.Direction.UP:
-                    pygame.draw.rect(surface, eye_color, (local_x + 4, local_y + 4, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (local_x + 12, local_y + 4, eye_size, eye_size))
-                else:  # DOWN
-                    pygame.draw.rect(surface, eye_color, (local_x + 4, local_y + 12, eye_size, eye_size))
-                    pygame.draw.rect(surface, eye_color, (local_x + 12, local_y + 12, eye_size, eye_size))
-            else:
-                # Body segments - slightly darker for depth effect
-                segment_color = tuple(max(0, c - 40) for c in self.color)
-                pygame.draw.rect(surface, segment_color, rect)
-                # Inner highlight for retro 3D effect
-                inner_rect = pygame.Rect(local_x + 2, local_y + 2, constants.CELL_SIZE - 5, constants.CELL_SIZE - 5)
-                pygame.draw.rect(surface, self.color, inner_rect)
-
+            tile = head_tiles[self.direction] if i == 0 else body_tile
+            blit_list.append((tile, (px - mon_x, py - mon_y)))
+        surface.blits(blit_list, doreturn=False)
@@ -9,27 +9,36 @@ from retro_snake import constants
 
 
 class StarField:
-    """Retro starfield background effect"""
+    """Retro starfield background effect, stored as parallel per-star lists"""
     def __init__(self, num_stars=100, width=None, height=None):
-        self.stars = []
+        self.xs = []
+        self.ys = []
+        self.brightness = []
+        self.speeds = []
+        self.phases = []
         # Use provided dimensions or fall back to globals
         w = width if width is not None else constants.SCREEN_WIDTH
         h = height if height is not None else constants.SCREEN_HEIGHT
         for _ in range(num_stars):
-            x = random.randint(0, w)
-            y = random.randint(0, h)
-            brightness = random.randint(50, 150)
-            twinkle_speed = random.uniform(0.02, 0.08)
-            self.stars.append([x, y, brightness, twinkle_speed, random.uniform(0, math.pi * 2)])
+            self.xs.append(random.randint(0, w))
+            self.ys.append(random.randint(0, h))
+            self.brightness.append(random.randint(50, 150))
+            self.speeds.append(random.uniform(0.02, 0.08))
+            self.phases.append(random.uniform(0, math.pi * 2))
     
     def update(self):
-        for star in self.stars:
-            star[4] += star[3]  # Update twinkle phase
+        # Update twinkle phase
+        self.phases = [phase + speed for phase, speed in zip(self.phases, self.speeds)]
     
     def draw(self, surface):
-        for x, y, base_brightness, _, phase in self.stars:
-            brightness = int(base_brightness + math.sin(phase) * 30)
-            brightness = max(30, min(180, brightness))
-            color = (brightness, brightness, brightness)
-            surface.set_at((x, y), color)
-
+        sin = math.sin
+        set_at = surface.set_at
+        # Lock once for the whole batch instead of once per set_at call
+        surface.lock()
+        try:
+            for x, y, base_brightness, phase in zip(self.xs, self.ys, self.brightness, self.phases):
+                brightness = int(base_brightness + sin(phase) * 30)
+                brightness = max(30, min(180, brightness))
+                set_at((x, y), (brightness, brightness, brightness))
+        finally:
+            surface.unlock()
@@ -4,28 +4,40 @@ UI components for Retro Snake Screensaver configuration dialog
 
 import pygame
 import ctypes
+import time
+from ctypes import wintypes
 from retro_snake import constants
 from retro_snake.config import load_config, save_config
+from retro_snake.utils import cleanup_pygame, resource_path
 
 # Try to get Windows API for parent window detection
 try:
     user32 = ctypes.windll.user32
     
+    # Declare signatures up front so ctypes doesn't infer them on every call
+    FindWindow = user32.FindWindowW
+    FindWindow.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR]
+    FindWindow.restype = wintypes.HWND
+    
+    IsWindow = user32.IsWindow
+    IsWindow.argtypes = [wintypes.HWND]
+    IsWindow.restype = wintypes.BOOL
+    
     def find_screensaver_settings_window():
         """Find the Windows screensaver settings dialog window"""
         # Look for the Screen Saver Settings dialog
         # Class name is typically #32770 (dialog) with specific title
-        hwnd = user32.FindWindowW(None, "Screen Saver Settings")
+        hwnd = FindWindow(None, "Screen Saver Settings")
         if not hwnd:
             # Try alternative names
-            hwnd = user32.FindWindowW(None, "Bildschirmschonereinstellungen")  # German
+            hwnd = FindWindow(None, "Bildschirmschonereinstellungen")  # German
         return hwnd
     
     def is_window_valid(hwnd):
         """Check if a window handle is still valid"""
         if not hwnd:
             return False
-        return user32.IsWindow(hwnd)
+        return IsWindow(hwnd)
     
     HAS_WIN32_UI = True
 except (OSError, AttributeError):
@@ -38,6 +50,59 @@ except (OSError, AttributeError):
         return True
 
 
+# Default-font Font objects by size, shared by every dialog opened in this process
+_font_cache = {}
+
+
+def _get_font(size):
+    """Get the default font at size, loading it only once until pygame quits"""
+    font = _font_cache.get(size)
+    if font is None:
+        if not _font_cache:
+            # Fonts die with pygame.quit() (end of ConfigDialog.run), so forget
+            # them then; quit callbacks fire once, hence re-registering per fill
+            pygame.register_quit(_font_cache.clear)
+        font = _font_cache[size] = pygame.font.Font(None, size)
+    return font
+
+
+# Bevel shadow and sunken-track shading
+_DARK = (64, 64, 64)
+_DARKER = (32, 32, 32)
+
+# Checkmark polyline, relative to the checkbox's top-left corner
+_CHECK_POINTS = ((3, 8), (6, 11), (12, 5))
+
+# Colorkey for chrome pixels the bevel does not cover; never used as a widget color
+_CHROME_KEY = (255, 0, 255)
+
+
+def _bevel_surface(size, face, light, shadow):
+    """
+    Pre-render a widget face with its 2px Windows 95 bevel (light top/left,
+    shadow bottom/right). The bevel overhangs the right and bottom edges by a
+    pixel, so the surface is 2px larger than size, with uncovered pixels keyed out.
+    """
+    width, height = size
+    surf = pygame.Surface((width + 2, height + 2))
+    surf.fill(_CHROME_KEY)
+    surf.set_colorkey(_CHROME_KEY)
+    rect = pygame.Rect(0, 0, width, height)
+    pygame.draw.rect(surf, face, rect)
+    pygame.draw.line(surf, light, rect.topleft, rect.topright, 2)
+    pygame.draw.line(surf, light, rect.topleft, rect.bottomleft, 2)
+    pygame.draw.line(surf, shadow, rect.bottomleft, rect.bottomright, 2)
+    pygame.draw.line(surf, shadow, rect.topright, rect.bottomright, 2)
+    return _display_format(surf)
+
+
+def _display_format(surf):
+    """Convert surf to the display's pixel format so blits are plain copies (once a display exists)"""
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert()
+
+
 class RetroButton:
     """Retro Windows 95 style button"""
     def __init__(self, x, y, width, height, text, color=constants.GRAY):
@@ -46,32 +111,33 @@ class RetroButton:
         self.color = color
         self.hovered = False
         self.pressed = False
+        self.needs_redraw = False  # Set when the drawn state changes
+        self.bounds = self.rect.inflate(2, 2).move(1, 1)  # Screen area covered by draw(), incl. bevel overhang
+        self._text_cache = None  # (text, font, rendered surface, centered position)
+        self._pos = self.rect.topleft
+        # Face + 3D border per state, blitted instead of drawn each frame
+        self._surf_normal = _bevel_surface(self.rect.size, color, constants.WHITE, _DARK)
+        self._surf_pressed = _bevel_surface(self.rect.size, color, _DARK, constants.WHITE)
+    
+    def _text_surface(self, font):
+        """Get the rendered label and its centered position, re-rendering only when the text or font changes"""
+        cache = self._text_cache
+        if cache is None or cache[0] != self.text or cache[1] is not font:
+            text_surf = font.render(self.text, True, constants.BLACK).convert_alpha()
+            pos = text_surf.get_rect(center=self.rect.center).topleft
+            cache = self._text_cache = (self.text, font, text_surf, pos)
+        return cache[2], cache[3]
     
     def draw(self, surface, font):
-        # Button face
-        pygame.draw.rect(surface, self.color, self.rect)
-        
-        # 3D border effect (Windows 95 style)
-        if self.pressed:
-            # Pressed - inverted borders
-            pygame.draw.line(surface, (64, 64, 64), self.rect.topleft, self.rect.topright, 2)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.topleft, self.rect.bottomleft, 2)
-            pygame.draw.line(surface, constants.WHITE, self.rect.bottomleft, self.rect.bottomright, 2)
-            pygame.draw.line(surface, constants.WHITE, self.rect.topright, self.rect.bottomright, 2)
-        else:
-            # Normal - raised borders
-            pygame.draw.line(surface, constants.WHITE, self.rect.topleft, self.rect.topright, 2)
-            pygame.draw.line(surface, constants.WHITE, self.rect.topleft, self.rect.bottomleft, 2)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.bottomleft, self.rect.bottomright, 2)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.topright, self.rect.bottomright, 2)
+        # Button face with 3D border (Windows 95 style) - inverted when pressed
+        surface.blit(self._surf_pressed if self.pressed else self._surf_normal, self._pos)
         
         # Text
-        text_surf = font.render(self.text, True, constants.BLACK)
-        text_rect = text_surf.get_rect(center=self.rect.center)
+        text_surf, (text_x, text_y) = self._text_surface(font)
         if self.pressed:
-            text_rect.x += 1
-            text_rect.y += 1
-        surface.blit(text_surf, text_rect)
+            text_x += 1
+            text_y += 1
+        surface.blit(text_surf, (text_x, text_y))
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -79,9 +145,12 @@ class RetroButton:
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.pressed = True
+                self.needs_redraw = True
         elif event.type == pygame.MOUSEBUTTONUP:
             was_pressed = self.pressed
             self.pressed = False
+            if was_pressed:
+                self.needs_redraw = True
             if was_pressed and self.rect.collidepoint(event.pos):
                 return True  # Click!
         return False
@@ -97,32 +166,32 @@ class RetroCheckbox:
         self.size = 16
         self.rect = pygame.Rect(x, y, self.size, self.size)
         self.hovered = False
+        self.needs_redraw = False  # Set when the drawn state changes
+        self.bounds = self.rect.inflate(2, 2).move(1, 1)  # Screen area covered by draw() (box + label once drawn)
+        self._label_cache = None  # (text, font, rendered surface)
+        self._pos = self.rect.topleft
+        self._label_pos = (x + self.size + 8, y)
+        # Box per state: raised with a checkmark when checked, sunken when not
+        self._surf_checked = _bevel_surface(self.rect.size, constants.GRAY, constants.WHITE, _DARK)
+        pygame.draw.lines(self._surf_checked, constants.BLACK, False, _CHECK_POINTS, 2)
+        self._surf_checked = _display_format(self._surf_checked)
+        self._surf_unchecked = _bevel_surface(self.rect.size, constants.GRAY, _DARK, constants.WHITE)
+    
+    def _label_surface(self, font):
+        """Get the rendered label, re-rendering only when the text or font changes"""
+        cache = self._label_cache
+        if cache is None or cache[0] != self.text or cache[1] is not font:
+            cache = self._label_cache = (self.text, font, font.render(self.text, True, constants.BRIGHT_GREEN).convert_alpha())
+        return cache[2]
     
     def draw(self, surface, font):
         # Checkbox box (sunken when unchecked, raised when checked)
-        if self.checked:
-            # Checked - raised
-            pygame.draw.rect(surface, constants.GRAY, self.rect)
-            pygame.draw.line(surface, constants.WHITE, self.rect.topleft, self.rect.topright, 2)
-            pygame.draw.line(surface, constants.WHITE, self.rect.topleft, self.rect.bottomleft, 2)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.bottomleft, self.rect.bottomright, 2)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.topright, self.rect.bottomright, 2)
-            # Draw checkmark
-            pygame.draw.line(surface, constants.BLACK, 
-                           (self.x + 3, self.y + 8), (self.x + 6, self.y + 11), 2)
-            pygame.draw.line(surface, constants.BLACK, 
-                           (self.x + 6, self.y + 11), (self.x + 12, self.y + 5), 2)
-        else:
-            # Unchecked - sunken
-            pygame.draw.rect(surface, constants.GRAY, self.rect)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.topleft, self.rect.topright, 2)
-            pygame.draw.line(surface, (64, 64, 64), self.rect.topleft, self.rect.bottomleft, 2)
-            pygame.draw.line(surface, constants.WHITE, self.rect.bottomleft, self.rect.bottomright, 2)
-            pygame.draw.line(surface, constants.WHITE, self.rect.topright, self.rect.bottomright, 2)
+        surface.blit(self._surf_checked if self.checked else self._surf_unchecked, self._pos)
         
         # Label text
-        label_surf = font.render(self.text, True, constants.BRIGHT_GREEN)
-        surface.blit(label_surf, (self.x + self.size + 8, self.y))
+        label_surf = self._label_surface(font)
+        label_rect = surface.blit(label_surf, self._label_pos)
+        self.bounds = self.rect.inflate(2, 2).move(1, 1).union(label_rect)
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -130,6 +199,7 @@ class RetroCheckbox:
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.checked = not self.checked
+                self.needs_redraw = True
                 return True  # Toggled
         return False
 
@@ -144,34 +214,48 @@ class RetroSlider:
         self.max_val = max_val
         self.value = value
         self.label = label
+        self._range = max_val - min_val
         self.dragging = False
+        self.needs_redraw = False  # Set when the drawn state changes
+        self.bounds = pygame.Rect(x, y, width + 2, 36)  # Label, track and handle, incl. bevel overhang
+        self._label_cache = {}  # (label, value, font) -> rendered surface, at most one per value
         self.track_rect = pygame.Rect(x, y + 20, width, 8)
+        self._track_pos = self.track_rect.topleft
         self.update_handle()
+        # Sunken track and raised handle, blitted instead of drawn each frame
+        # (the 1px lines overhang the far ends by a pixel, like the bevel)
+        self._track_surf = pygame.Surface((width + 1, 9))
+        self._track_surf.fill(_CHROME_KEY)
+        self._track_surf.set_colorkey(_CHROME_KEY)
+        track = pygame.Rect(0, 0, width, 8)
+        self._track_surf.fill(_DARK, track)
+        pygame.draw.line(self._track_surf, _DARKER, track.topleft, track.topright, 1)
+        pygame.draw.line(self._track_surf, _DARKER, track.topleft, track.bottomleft, 1)
+        self._track_surf = _display_format(self._track_surf)
+        self._handle_surf = _bevel_surface(self.handle_rect.size, constants.GRAY, constants.WHITE, _DARK)
     
     def update_handle(self):
-        ratio = (self.value - self.min_val) / (self.max_val - self.min_val)
-        handle_x = self.x + int(ratio * (self.width - 16))
+        # Integer math: same as truncating ratio * travel, without float ops
+        handle_x = self.x + (self.value - self.min_val) * (self.width - 16) // self._range
         self.handle_rect = pygame.Rect(handle_x, self.y + 14, 16, 20)
+        self._handle_pos = self.handle_rect.topleft
     
     def draw(self, surface, font):
         # Label - centered horizontally over the slider
-        label_text = f"{self.label}: {self.value}"
-        label_surf = font.render(label_text, True, constants.BRIGHT_GREEN)
+        key = (self.label, self.value, font)
+        label_surf = self._label_cache.get(key)
+        if label_surf is None:
+            label_text = f"{self.label}: {self.value}"
+            label_surf = self._label_cache[key] = font.render(label_text, True, constants.BRIGHT_GREEN).convert_alpha()
         label_rect = label_surf.get_rect()
         label_x = self.x + (self.width - label_rect.width) // 2  # Center over slider
         surface.blit(label_surf, (label_x, self.y))
         
         # Track (sunken)
-        pygame.draw.rect(surface, (64, 64, 64), self.track_rect)
-        pygame.draw.line(surface, (32, 32, 32), self.track_rect.topleft, self.track_rect.topright, 1)
-        pygame.draw.line(surface, (32, 32, 32), self.track_rect.topleft, self.track_rect.bottomleft, 1)
+        surface.blit(self._track_surf, self._track_pos)
         
         # Handle (raised)
-        pygame.draw.rect(surface, constants.GRAY, self.handle_rect)
-        pygame.draw.line(surface, constants.WHITE, self.handle_rect.topleft, self.handle_rect.topright, 2)
-        pygame.draw.line(surface, constants.WHITE, self.handle_rect.topleft, self.handle_rect.bottomleft, 2)
-        pygame.draw.line(surface, (64, 64, 64), self.handle_rect.bottomleft, self.handle_rect.bottomright, 2)
-        pygame.draw.line(surface, (64, 64, 64), self.handle_rect.topright, self.handle_rect.bottomright, 2)
+        surface.blit(self._handle_surf, self._handle_pos)
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -184,33 +268,55 @@ class RetroSlider:
             self._update_value(event.pos[0])
     
     def _update_value(self, mouse_x):
-        ratio = (mouse_x - self.x) / self.width
-        ratio = max(0, min(1, ratio))
-        self.value = int(self.min_val + ratio * (self.max_val - self.min_val))
-        self.update_handle()
+        dx = mouse_x - self.x
+        if dx < 0:
+            dx = 0
+        elif dx > self.width:
+            dx = self.width
+        value = self.min_val + dx * self._range // self.width
+        if value != self.value:
+            self.value = value
+            self.update_handle()
+            self.needs_redraw = True
 
 
 class ConfigDialog:
     """Retro Windows 95 style configuration dialog"""
     def __init__(self):
-        pygame.init()
+        # Only what a settings window needs - skip probing audio, joysticks, etc.
+        pygame.display.init()
+        pygame.font.init()
         
         self.width = 450
         self.height = 640
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Snake Screensaver Settings")
         
+        # Only the mouse, closing and re-exposure matter here; drop everything
+        # else (keys, text input, focus, ...) in SDL before it reaches the queue.
+        # pygame.quit() in run() resets this for anything that runs afterwards.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.WINDOWEXPOSED, pygame.MOUSEMOTION,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP])
+        pygame.key.stop_text_input()
+        
         # Find and track the Windows screensaver settings dialog
         # so we can close when it closes
         self.parent_hwnd = find_screensaver_settings_window()
+        if self.parent_hwnd:
+            parent_hwnd = self.parent_hwnd
+            self._parent_closed = lambda: not is_window_valid(parent_hwnd)
+        else:
+            # Not launched from the settings dialog - nothing to watch
+            self._parent_closed = lambda: False
         
-        # Load current config
+        # Load current config (load_config fills in every known key)
         self.config = load_config()
+        self._loaded_config = dict(self.config)  # To skip saving when nothing changed
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 32)
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = _get_font(24)
+        self.small_font = _get_font(20)
         
         # Create UI elements
         # Calculate slider width and position to stretch across panel (with margins)
@@ -223,52 +329,83 @@ class ConfigDialog:
             RetroSlider(slider_x, 140, slider_width, 5, 200, self.config['num_food'], "Food Items"),
             RetroSlider(slider_x, 200, slider_width, 5, 120, self.config['speed'], "Speed (FPS)"),
             RetroSlider(slider_x, 260, slider_width, 0, 100, self.config['dodge_chance'], "Dodge Chance %"),
-            RetroSlider(slider_x, 320, slider_width, 1, 100, self.config.get('min_starting_length', 4), "Min Starting Length"),
-            RetroSlider(slider_x, 380, slider_width, 1, 100, self.config.get('max_starting_length', 4), "Max Starting Length"),
+            RetroSlider(slider_x, 320, slider_width, 1, 100, self.config['min_starting_length'], "Min Starting Length"),
+            RetroSlider(slider_x, 380, slider_width, 1, 100, self.config['max_starting_length'], "Max Starting Length"),
         ]
         
         # Checkbox for showing/hiding leaderboard
-        show_leaderboard = self.config.get('show_leaderboard', True)
+        show_leaderboard = self.config['show_leaderboard']
         self.show_leaderboard_checkbox = RetroCheckbox(slider_x, 440, "Show Scores and Names", show_leaderboard)
         
         # Checkbox for transparent background mode
-        transparent_mode = self.config.get('transparent_mode', False)
+        transparent_mode = self.config['transparent_mode']
         self.transparent_mode_checkbox = RetroCheckbox(slider_x, 465, "Desktop Background (trails cover screen)", transparent_mode)
         
         # Slider for trail darkness (only relevant in transparent mode)
-        trail_darkness = self.config.get('trail_darkness', self.config.get('trail_fade_rate', 5))
+        trail_darkness = self.config['trail_darkness']
         self.trail_darkness_slider = RetroSlider(slider_x, 495, slider_width, 0, 20, trail_darkness, "Trail Darkness")
         
         # Checkbox for accumulative trails
-        accumulative_trails = self.config.get('accumulative_trails', True)
+        accumulative_trails = self.config['accumulative_trails']
         self.accumulative_trails_checkbox = RetroCheckbox(slider_x, 540, "Accumulative Trails (darker with each pass)", accumulative_trails)
         
         self.ok_button = RetroButton(120, 580, 80, 30, "OK")
         self.cancel_button = RetroButton(220, 580, 80, 30, "Cancel")
         self.preview_button = RetroButton(320, 580, 80, 30, "Preview")
         
-        self.running = True
-        self.result = None  # 'ok', 'cancel', or 'preview'
+        # Every widget, for collecting the areas that need repainting
+        self.widgets = self.sliders + [
+            self.show_leaderboard_checkbox,
+            self.transparent_mode_checkbox,
+            self.trail_darkness_slider,
+            self.accumulative_trails_checkbox,
+            self.ok_button,
+            self.cancel_button,
+            self.preview_button,
+        ]
         
-        self.clock = pygame.time.Clock()
-    
-    def draw(self):
-        # Background - very dark (almost black)
-        self.screen.fill((10, 10, 10))
+        # Widgets each mouse event type can affect; buttons are handled separately
+        # for their results. Motion only reaches sliders while they are dragged,
+        # hover is tracked by _update_hover.
+        self._all_sliders = self.sliders + [self.trail_darkness_slider]
+        self._checkboxes = [
+            self.show_leaderboard_checkbox,
+            self.transparent_mode_checkbox,
+            self.accumulative_trails_checkbox,
+        ]
+        self._handlers = {
+            pygame.MOUSEBUTTONDOWN: self._all_sliders + self._checkboxes,
+            pygame.MOUSEBUTTONUP: self._all_sliders,
+            pygame.MOUSEMOTION: [],
+        }
         
-        # Title bar
-        title_rect = pygame.Rect(0, 0, self.width, 35)
-        pygame.draw.rect(self.screen, (0, 0, 128), title_rect)
-        title_text = self.title_font.render("🐍 Snake Screensaver Settings", True, constants.WHITE)
-        self.screen.blit(title_text, (10, 5))
+        # Hover regions: the checkbox column and the button row, each with its widgets
+        buttons = [self.ok_button, self.cancel_button, self.preview_button]
+        self._hover_regions = [
+            (self._checkboxes[0].rect.unionall([c.rect for c in self._checkboxes[1:]]), self._checkboxes),
+            (buttons[0].rect.unionall([b.rect for b in buttons[1:]]), buttons),
+        ]
         
-        # Main panel (raised) - dark grey instead of light grey
+        # Everything that never changes, painted once: very dark background,
+        # title bar, raised main panel (dark grey instead of light grey) and version info
+        self._background = pygame.Surface((self.width, self.height)).convert()
+        self._background.fill((10, 10, 10))
+        pygame.draw.rect(self._background, (0, 0, 128), pygame.Rect(0, 0, self.width, 35))
+        # Title is pre-rendered (see create_title.py) rather than rendered through a font each open
+        title_surf = pygame.image.load(resource_path('title.png')).convert_alpha()
+        self._background.blit(title_surf, (10, 5))
         panel = pygame.Rect(10, 45, self.width - 20, self.height - 55)
-        pygame.draw.rect(self.screen, (20, 20, 20), panel)
-        pygame.draw.line(self.screen, constants.WHITE, panel.topleft, panel.topright, 2)
-        pygame.draw.line(self.screen, constants.WHITE, panel.topleft, panel.bottomleft, 2)
-        pygame.draw.line(self.screen, (64, 64, 64), panel.bottomleft, panel.bottomright, 2)
-        pygame.draw.line(self.screen, (64, 64, 64), panel.topright, panel.bottomright, 2)
+        self._background.blit(_bevel_surface(panel.size, (20, 20, 20), constants.WHITE, _DARK), panel.topleft)
+        version_text = self.small_font.render("Hack's Retro Snake Screensaver v1.0", True, _DARK)
+        self._background.blit(version_text, (140, 620))
+        
+        self.running = True
+        self.result = None  # 'ok', 'cancel', or 'preview'
+    
+    def draw(self, dirty_rects=None):
+        """Paint the dialog; present only dirty_rects if given, else the whole window"""
+        # Background, title bar, main panel and version info
+        self.screen.blit(self._background, (0, 0))
         
         # Sliders
         for slider in self.sliders:
@@ -289,43 +426,54 @@ class ConfigDialog:
         self.cancel_button.draw(self.screen, self.font)
         self.preview_button.draw(self.screen, self.font)
         
-        # Version info
-        version_text = self.small_font.render("Hack's Retro Snake Screensaver v1.0", True, (64, 64, 64))
-        self.screen.blit(version_text, (140, 620))
-        
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
     
     def run(self):
-        frame_count = 0
+        self.draw()  # First frame presents the whole window
+        # time.monotonic, not pygame.time.get_ticks: that stays 0 without pygame.init()
+        next_parent_check = time.monotonic() + 1.0
         while self.running:
-            frame_count += 1
+            exposed = False
             
             # Check if parent Windows screensaver settings dialog is still open
-            # Only check every 30 frames (~1 second) to reduce overhead
-            if frame_count % 30 == 0 and self.parent_hwnd:
-                if not is_window_valid(self.parent_hwnd):
+            # Only check about once a second to reduce overhead
+            now = time.monotonic()
+            if now >= next_parent_check:
+                next_parent_check = now + 1.0
+                if self._parent_closed():
                     # Parent closed, save and exit
                     self.save_settings()
                     self.result = 'ok'
                     self.running = False
                     break
             
-            for event in pygame.event.get():
+            # Sleep until input arrives (at most 100 ms), then drain the queue
+            events = [pygame.event.wait(timeout=100)] + pygame.event.get()
+            for event in events:
+                if event.type == pygame.NOEVENT:
+                    continue  # Wait timed out
                 if event.type == pygame.QUIT:
                     self.running = False
                     self.result = 'cancel'
+                elif event.type == pygame.WINDOWEXPOSED:
+                    exposed = True  # Window contents were lost - repaint everything
                 
-                # Handle sliders
-                for slider in self.sliders:
-                    slider.handle_event(event)
+                handlers = self._handlers.get(event.type)
+                if handlers is None:
+                    continue  # No widget reacts to anything but the mouse
                 
-                # Handle checkboxes
-                self.show_leaderboard_checkbox.handle_event(event)
-                self.transparent_mode_checkbox.handle_event(event)
-                self.accumulative_trails_checkbox.handle_event(event)
-                
-                # Handle trail darkness slider
-                self.trail_darkness_slider.handle_event(event)
+                # Handle sliders and checkboxes
+                for widget in handlers:
+                    widget.handle_event(event)
+                if event.type == pygame.MOUSEMOTION:
+                    self._update_hover(event.pos)
+                    continue  # Motion never clicks a button
+                # A press may have started a drag and a release ended it
+                self._handlers[pygame.MOUSEMOTION] = [
+                    slider for slider in self._all_sliders if slider.dragging]
                 
                 # Handle buttons
                 if self.ok_button.handle_event(event):
@@ -342,32 +490,45 @@ class ConfigDialog:
                     self.result = 'preview'
                     self.running = False
             
-            self.draw()
-            self.clock.tick(30)
-        
-        try:
-            pygame.display.quit()
-        except:
-            pass
-        
-        try:
-            pygame.quit()
-        except:
-            pass
+            # Repaint only when a widget changed, presenting just the changed areas
+            # (or the whole window after it was exposed)
+            dirty_rects = []
+            for widget in self.widgets:
+                if widget.needs_redraw:
+                    widget.needs_redraw = False
+                    dirty_rects.append(widget.bounds)
+            if self.running and (exposed or dirty_rects):
+                self.draw(None if exposed else dirty_rects)
         
+        cleanup_pygame()
         return self.result
     
+    def _update_hover(self, pos):
+        """Track checkbox/button hover, hit-testing only the region under the cursor"""
+        for region, widgets in self._hover_regions:
+            if region.collidepoint(pos):
+                for widget in widgets:
+                    widget.hovered = widget.rect.collidepoint(pos)
+            else:
+                for widget in widgets:
+                    widget.hovered = False
+    
     def save_settings(self):
-        """Save current slider values to config"""
-        self.config['num_snakes'] = self.sliders[0].value
-        self.config['num_food'] = self.sliders[1].value
-        self.config['speed'] = self.sliders[2].value
-        self.config['dodge_chance'] = self.sliders[3].value
-        self.config['min_starting_length'] = self.sliders[4].value
-        self.config['max_starting_length'] = self.sliders[5].value
-        self.config['show_leaderboard'] = self.show_leaderboard_checkbox.checked
-        self.config['transparent_mode'] = self.transparent_mode_checkbox.checked
-        self.config['trail_darkness'] = self.trail_darkness_slider.value
-        self.config['accumulative_trails'] = self.accumulative_trails_checkbox.checked
+        """Save current slider values to config (no disk write if nothing changed)"""
+        self.config.update({
+            'num_snakes': self.sliders[0].value,
+            'num_food': self.sliders[1].value,
+            'speed': self.sliders[2].value,
+            'dodge_chance': self.sliders[3].value,
+            'min_starting_length': self.sliders[4].value,
+            'max_starting_length': self.sliders[5].value,
+            'show_leaderboard': self.show_leaderboard_checkbox.checked,
+            'transparent_mode': self.transparent_mode_checkbox.checked,
+            'trail_darkness': self.trail_darkness_slider.value,
+            'accumulative_trails': self.accumulative_trails_checkbox.checked,
+        })
+        if self.config == self._loaded_config:
+            return
         save_config(self.config)
+        self._loaded_config = dict(self.config)
 
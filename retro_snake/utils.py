@@ -4,6 +4,8 @@ Utility functions for Retro Snake Screensaver
 
 import ctypes
 import atexit
+import os
+import sys
 import pygame
 
 # Global flag to track if we've registered the atexit handler
@@ -12,14 +14,16 @@ _atexit_registered = False
 
 def _emergency_cleanup():
     """Emergency cleanup function called at exit"""
-    try:
-        pygame.display.quit()
-    except:
-        pass
-    try:
-        pygame.quit()
-    except:
-        pass
+    # Usually a no-op: cleanup_pygame() has normally run already
+    cleanup_pygame()
+
+
+def resource_path(name):
+    """Get the path of a file in retro_snake/assets, also inside a PyInstaller bundle"""
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if bundle_dir is not None:
+        return os.path.join(bundle_dir, 'retro_snake', 'assets', name)
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', name)
 
 
 def register_atexit_cleanup():
@@ -42,13 +46,12 @@ def setup_dpi_awareness():
 
 
 def cleanup_pygame():
-    """Ensure pygame is fully cleaned up"""
-    try:
+    """Ensure pygame is fully cleaned up (safe to call any number of times)"""
+    if pygame.font.get_init():
+        pygame.font.quit()
+    if pygame.display.get_init():
         pygame.display.quit()
-    except:
-        pass
-    try:
-        pygame.quit()
-    except:
-        pass
+    # Not gated on pygame.get_init(): that stays False when only some subsystems
+    # were initialised (the config dialog), but quit callbacks must still run
+    pygame.quit()
 